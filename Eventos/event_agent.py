@@ -65,6 +65,28 @@ from spade.message import Message
 from spade.presence import PresenceType, PresenceShow
 from logger_utils import MessageLogger
 
+# orjson is optional: it parses the per-tick vehicle updates several times
+# faster than json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(body):
+    """Parse a JSON message body, using orjson when it is installed.
+    
+    orjson rejects the NaN/Infinity literals that json emits (e.g. a vehicle
+    reporting an infinite time), so bodies it cannot parse are handed to
+    json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
 
 class Event:
     """Temporal event representation for supply chain simulation.
@@ -990,7 +1012,7 @@ class EventDrivenAgent(Agent):
                     # Verificar se é resposta do world agent com eventos de trânsito
                     if msg.get_metadata("performative") == "inform" and msg.get_metadata("action") == "traffic_events":
                         # Mensagem do world agent com eventos de trânsito
-                        data = json.loads(msg.body)
+                        data = _loads(msg.body)
                         events = data.get("events", [])
                         
                         if self.agent.verbose:
@@ -1040,7 +1062,7 @@ class EventDrivenAgent(Agent):
                         return
                     
                     # Processar outros eventos normalmente
-                    data = json.loads(msg.body)
+                    data = _loads(msg.body)
                     event_type = data.get("type")
                     time = data.get("time", 0.0)
                     event_data = data.get("data", {})
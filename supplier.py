@@ -594,7 +594,7 @@ class Supplier(Agent):
             msg.set_metadata("warehouse_id", str(order.sender))
             msg.set_metadata("node_id", str(self.agent.node_id))
             msg.set_metadata("request_id", str(order.orderid))
-            msg.body = json.dumps(order.__dict__)
+            msg.body = json.dumps(order.to_dict())
             return msg
         
         async def run(self):
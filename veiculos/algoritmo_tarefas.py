@@ -27,8 +27,10 @@ Classes:
 
 Functions:
     get_dijkstra_cached: Returns Dijkstra result with caching.
-    clear_dijkstra_cache: Clears the global route cache.
+    clear_dijkstra_cache: Clears the calling thread's route cache.
     calculate_heuristic: Calculates h(n) for a given state.
+    remaining_time_lower_bound: Lower bound on the time left to finish a node's tasks.
+    single_task_plan: Closed-form plan for a single task.
     A_star_task_algorithm: Executes A* and returns the optimal route.
 
 Usage Example:
@@ -70,8 +72,10 @@ Performance Considerations:
     - Lambda penalty parameter affects route structure (higher λ → fewer concurrent tasks)
 """
 
+import heapq
 import sys
 import os
+import threading
 from typing import TYPE_CHECKING
 
 # Add parent directory to path for absolute imports
@@ -83,8 +87,18 @@ from world.graph import Graph
 if TYPE_CHECKING:
     from veiculos.veiculos import Order
 
-# Global cache to store Dijkstra algorithm results
-_dijkstra_cache = {}
+# Per-thread search buffers (route cache and A* open list). Vehicles run the
+# planner in worker threads, so each thread reuses its own buffers across calls
+# instead of allocating new ones or sharing a cache another search may clear.
+_arena = threading.local()
+
+def _thread_arena():
+    """Returns the calling thread's search buffers, creating them on first use."""
+    arena = _arena
+    if not hasattr(arena, "open_list"):
+        arena.open_list = []
+        arena.dijkstra_cache = {}
+    return arena
 
 def get_dijkstra_cached(graph: Graph, start: int, end: int):
     """Returns Dijkstra algorithm result using cache to avoid recalculations.
@@ -108,7 +122,7 @@ def get_dijkstra_cached(graph: Graph, start: int, end: int):
             - time (float): Total travel time in seconds.
     
     Side Effects:
-        Modifies the global _dijkstra_cache dictionary by adding new results.
+        Modifies the calling thread's Dijkstra cache by adding new results.
     
     Examples:
         >>> result1 = get_dijkstra_cached(graph, 3, 7)  # Computes and stores
@@ -117,7 +131,7 @@ def get_dijkstra_cached(graph: Graph, start: int, end: int):
         >>> # Cache hit provides O(1) lookup vs O(V²) for full Dijkstra
     
     Notes:
-        - Cache is global and persists between A* calls
+        - Cache is per thread and persists between A* calls in that thread
         - Use clear_dijkstra_cache() to clear before new execution
         - Performance: O(1) for cache hits, O(V²) for misses (full Dijkstra)
         - Memory: O(N²) worst case if all node pairs are queried
@@ -127,13 +141,15 @@ def get_dijkstra_cached(graph: Graph, start: int, end: int):
         Cache misses trigger a call to graph.djikstra() which implements
         Dijkstra's algorithm with priority queue (typically O(E log V) complexity).
     """
+    cache = _thread_arena().dijkstra_cache
     cache_key = (start, end)
-    if cache_key not in _dijkstra_cache:
-        _dijkstra_cache[cache_key] = graph.djikstra(start, end)
-    return _dijkstra_cache[cache_key]
+    result = cache.get(cache_key)
+    if result is None:
+        result = cache[cache_key] = graph.djikstra(start, end)
+    return result
 
 def clear_dijkstra_cache():
-    """Clears the global Dijkstra results cache.
+    """Clears the calling thread's Dijkstra results cache.
     
     Should be called before each A* execution to avoid using outdated routes
     if the graph has changed (e.g., traffic updates, road closures).
@@ -142,7 +158,7 @@ def clear_dijkstra_cache():
     involve FIPA protocol communication.
     
     Side Effects:
-        Resets the global _dijkstra_cache dictionary to empty.
+        Empties the calling thread's Dijkstra cache.
     
     Examples:
         >>> clear_dijkstra_cache()
@@ -159,8 +175,7 @@ def clear_dijkstra_cache():
         paths from scratch. For a graph with V vertices and typical VRP with N tasks,
         expect approximately O(N*V) Dijkstra calls during first A* execution.
     """
-    global _dijkstra_cache
-    _dijkstra_cache = {}
+    _thread_arena().dijkstra_cache.clear()
 
 class TreeNode:
     """Represents a node in the A* search tree.
@@ -224,7 +239,7 @@ class TreeNode:
         >>> print(len(root.children))  # 2 (one child for each available pickup)
     
     Notes:
-        - Comparison (__gt__, __eq__) based on f(n) for PriorityQueue usage
+        - Comparison (__gt__, __eq__) based on f(n) for priority queue usage
         - order_id is None only for root node
         - Goal state has depth = 2 * num_tasks (pickup + delivery per task)
         - quantity attribute tracks current load, updated when creating children
@@ -242,6 +257,13 @@ class TreeNode:
         Goal (depth=2N): All N pickups and N deliveries completed
     """
     
+    # A search creates one node per explored transition, so nodes carry no
+    # per-instance __dict__
+    __slots__ = ('state', 'parent', 'location', 'order_id', 'children',
+                 'initial_points_reached', 'end_points_reached', 'available_points',
+                 'depth', 'quantity', 'max_fuel', 'max_quantity', 'h', 'g', 'f',
+                 'average_cost_per_task', 'lambda_penalty')
+    
     def __init__(self, 
                  location,
                  state: list["Order"],
@@ -311,7 +333,7 @@ class TreeNode:
     def __gt__(self, other):
         """Comparison operator greater than (>) based on f(n).
         
-        Used by PriorityQueue to order nodes. Nodes with lower f(n) have
+        Used by the A* priority queue to order nodes. Nodes with lower f(n) have
         higher priority (are expanded first) in the A* algorithm.
         
         This method enables the priority queue to maintain nodes sorted by
@@ -325,14 +347,14 @@ class TreeNode:
         
         Notes:
             - Lower f(n) means better (more promising) node
-            - PriorityQueue uses min-heap, so __gt__ reverses order
-            - Ties in f(n) are broken by object ID in PriorityQueue
+            - The open list is a min-heap, so __gt__ reverses order
+            - Ties in f(n) are broken by object ID in the open list
         
         Examples:
             >>> node1 = TreeNode(..., g=10, h=5)  # f = 15
             >>> node2 = TreeNode(..., g=8, h=4)   # f = 12
             >>> node1 > node2  # True (15 > 12)
-            >>> # In PriorityQueue, node2 will be expanded first
+            >>> # In the open list, node2 will be expanded first
         """
         return self.f > other.f
     
@@ -490,7 +512,7 @@ class TreeNode:
             
             1. If pickup not yet performed:
                - Check if qty + current_load ≤ max_quantity
-               - Calculate route and fuel using get_dijkstra_cached
+               - Calculate route fuel and time using graph.route_cost
                - If fuel ≤ max_fuel: add sender to available points (type=1)
             
             2. If pickup already performed but delivery not:
@@ -521,7 +543,9 @@ class TreeNode:
             # [(7, 1, 10, 3.2, 0), (5, 2, 15, 6.1, 1)]  # Delivery 1 + Pickup 2
         
         Notes:
-            - Uses Dijkstra cache via get_dijkstra_cached for performance
+            - Reads route fuel and time with graph.route_cost(), which answers
+              from the per-source cost arrays of the graph's shortest-path trees
+              (same values as graph.djikstra(), computed once per graph version)
             - Does not modify node state (pure method)
             - Result should be manually assigned to self.available_points
             - Capacity check is pre-emptive (before route calculation)
@@ -533,17 +557,20 @@ class TreeNode:
             Precedence: Enforces pickup before delivery for same order
             Uniqueness: Prevents revisiting same pickup/delivery location
         """
+        # Only fuel and time are needed, read in O(1) from the cost arrays kept
+        # with the graph's shortest-path trees
+        route_cost = graph.route_cost
         available_points = []
         for sender_location, receiver_location, quantity,orderid in self.state:
             if quantity + self.quantity > self.max_quantity:
                 continue
             if (orderid,sender_location) not in self.initial_points_reached:
-                _ ,fuel,time = get_dijkstra_cached(graph, self.location, sender_location)
+                fuel, time = route_cost(self.location, sender_location)
                 if fuel <= self.max_fuel:
                     available_points.append((sender_location, orderid, quantity,time, 1))
             else: 
                 if (orderid,receiver_location) not in self.end_points_reached:
-                    _ ,fuel,time = get_dijkstra_cached(graph, self.location, receiver_location)
+                    fuel, time = route_cost(self.location, receiver_location)
                     if fuel <= self.max_fuel:
                         available_points.append((receiver_location, orderid, quantity,time, 0))
 
@@ -780,6 +807,74 @@ def calculate_heuristic(state,end_points_reached,initial_points_reached,average_
     return (average_cost_per_task * (total_tasks - completed_tasks)) - (lambda_penalty * active_tasks)
 
 
+def remaining_time_lower_bound(node, graph: Graph, min_incoming: dict):
+    """Returns a lower bound on the travel time still needed to finish a node's tasks.
+    
+    Every remaining pickup or delivery location other than the current one has
+    to be entered through one of its incoming edges, so the sum of their
+    cheapest incoming edge weights never exceeds the real remaining time.
+    Unlike calculate_heuristic(), this bound is admissible and is only used to
+    prune branches that cannot beat a complete plan already found.
+    
+    Args:
+        node (TreeNode): Search node to evaluate.
+        graph (Graph): Graph instance containing the network topology.
+        min_incoming (dict): Result of graph.min_incoming_weights().
+    
+    Returns:
+        float: Lower bound on the time to complete the remaining tasks.
+    
+    Notes:
+        - Locations unreachable from the node's location are ignored, since the
+          route search reports them with zero travel time
+    """
+    remaining = set()
+    for sender_location, receiver_location, quantity, orderid in node.state:
+        if (orderid, sender_location) not in node.initial_points_reached:
+            remaining.add(sender_location)
+        if (orderid, receiver_location) not in node.end_points_reached:
+            remaining.add(receiver_location)
+    remaining.discard(node.location)
+    return sum(min_incoming.get(location, 0) for location in remaining
+               if graph.same_component(node.location, location))
+
+
+def single_task_plan(graph: Graph, start: int, task: tuple, capacity: int, max_fuel: int):
+    """Plans a single task without building a search tree.
+    
+    With one task the A* tree is a chain: the only move from the root is the
+    pickup and the only move after it is the delivery. This function applies
+    the same checks as TreeNode.evaluate_available_points() to those two moves
+    (including its capacity check against the load already on board) and
+    sums their times in the same order, so it returns exactly the plan the
+    search would find. Every proposal evaluation plans its order on its own,
+    which makes this the most frequent call.
+    
+    Args:
+        graph (Graph): Graph instance containing the network topology.
+        start (int): Starting node ID.
+        task (tuple): Task as (sender_location, receiver_location, quantity, orderid).
+        capacity (int): Maximum vehicle capacity.
+        max_fuel (int): Maximum fuel tank capacity.
+    
+    Returns:
+        tuple: (path, total_time) as in A_star_task_algorithm(), or None if the
+            task is infeasible (left to the search, which reports it).
+    """
+    sender_location, receiver_location, quantity, orderid = task
+    # Mirrors TreeNode.evaluate_available_points, which re-checks capacity at delivery
+    if 2 * quantity > capacity:
+        return None
+    pickup_fuel, pickup_time = graph.route_cost(start, sender_location)
+    if pickup_fuel > max_fuel:
+        return None
+    delivery_fuel, delivery_time = graph.route_cost(sender_location, receiver_location)
+    if delivery_fuel > max_fuel:
+        return None
+    path = [(start, None), (sender_location, orderid), (receiver_location, orderid)]
+    return path, pickup_time + delivery_time
+
+
 def A_star_task_algorithm(graph: Graph, start:int, tasks:list["Order"],capacity:int, max_fuel: int):
     """Executes the A* algorithm to find optimal sequence of pickups and deliveries.
     
@@ -801,7 +896,7 @@ def A_star_task_algorithm(graph: Graph, start:int, tasks:list["Order"],capacity:
            - Create root node at location=start
         
         2. A* Search:
-           - Use PriorityQueue to expand nodes with lowest f(n)
+           - Use a heap to expand nodes with lowest f(n)
            - For each node: evaluate available points, create children
            - Add children to queue
            - Stop when depth = 2 * num_tasks (all tasks completed)
@@ -854,12 +949,16 @@ def A_star_task_algorithm(graph: Graph, start:int, tasks:list["Order"],capacity:
         - If tasks empty: returns ([(start, None)], 0.0, root)
         - If no feasible solution: returns (None, float('inf'), root)
             and generates visualization showing search tree
+        - A single feasible task is planned by single_task_plan(); the
+          returned root is then not expanded
     
     Notes:
         - Goal is depth = 2 * len(tasks) (1 pickup + 1 delivery per task)
-        - PriorityQueue uses (f, id(node), node) for tie-breaking by ID
+        - Open list is a heapq of (f, id(node), node), tie-breaking by ID
         - order_id=None in root node (initial position without associated task)
         - Search is optimal (finds minimum cost solution) if heuristic is admissible
+        - Branches whose remaining_time_lower_bound() already exceeds the cheapest
+          complete plan generated so far are never expanded
 
     Integration with SPADE Agents:
         While this function itself doesn't use FIPA, it integrates with SPADE agents:
@@ -869,7 +968,6 @@ def A_star_task_algorithm(graph: Graph, start:int, tasks:list["Order"],capacity:
         4. Warehouse agents receive INFORM about pickup times from route
     """
     # Simplified A* algorithm implementation for task ordering
-    from queue import PriorityQueue
     
     # Clear Dijkstra cache for new execution
     clear_dijkstra_cache()
@@ -897,13 +995,33 @@ def A_star_task_algorithm(graph: Graph, start:int, tasks:list["Order"],capacity:
         average_cost_per_task=average_cost_per_task
     )
     
-    # Priority queue for A*
-    open_list = PriorityQueue()
-    open_list.put((root.f, id(root), root))
+    # One task needs no search
+    if len(initial_state) == 1:
+        plan = single_task_plan(graph, start, initial_state[0], capacity, max_fuel)
+        if plan is not None:
+            return plan[0], plan[1], root
+    
+    # Priority queue for A* (a binary heap reused by every search of this thread)
+    open_list = _thread_arena().open_list
+    open_list.clear()
+    heapq.heappush(open_list, (root.f, id(root), root))
     target_depth = 2 * len(tasks)
     
-    while not open_list.empty():
-        _, _, current_node = open_list.get()
+    # Cheapest complete plan generated so far. Goal nodes have h = 0, so any
+    # branch whose admissible lower bound exceeds it would be popped after that
+    # plan and can be dropped without changing the result. The tolerance
+    # absorbs the rounding of Dijkstra times (3 decimals per segment).
+    min_incoming = graph.min_incoming_weights()
+    incumbent = float('inf')
+    tolerance = 0.001 * target_depth
+    
+    while open_list:
+        _, _, current_node = heapq.heappop(open_list)
+        
+        # Skip branches that can no longer beat the incumbent plan
+        if (current_node.depth < target_depth and current_node.g
+                + remaining_time_lower_bound(current_node, graph, min_incoming) > incumbent + tolerance):
+            continue
         
         # Check if we reached the goal
         if current_node.depth == target_depth:
@@ -920,6 +1038,7 @@ def A_star_task_algorithm(graph: Graph, start:int, tasks:list["Order"],capacity:
             
             # Return: path with tuples (location, order_id), total time, search tree
             total_time = current_node.g
+            open_list.clear()
             return path, total_time, root
         
         # Evaluate available points
@@ -929,7 +1048,11 @@ def A_star_task_algorithm(graph: Graph, start:int, tasks:list["Order"],capacity:
         
         # Add children to priority queue
         for child in current_node.children:
-            open_list.put((child.f, id(child), child))
+            if child.depth == target_depth:
+                incumbent = min(incumbent, child.g)
+            elif child.g + remaining_time_lower_bound(child, graph, min_incoming) > incumbent + tolerance:
+                continue
+            heapq.heappush(open_list, (child.f, id(child), child))
     
     root.plot_tree("route_search.png")
     
@@ -45,26 +45,184 @@ FIPA Protocol Implementation:
     - `request`: Vehicles request pickups/deliveries from suppliers/stores
 """
 
-import copy
 from spade.agent import Agent
 from spade.behaviour import CyclicBehaviour, OneShotBehaviour, PeriodicBehaviour
 from spade.message import Message
 from spade.presence import PresenceType, PresenceShow
+from spade.template import Template
 import asyncio
+from array import array
 from datetime import datetime
 import random
 import json
+import atexit
+import logging
+import math
+import queue
 import sys
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, deque
+from itertools import accumulate
+from logging.handlers import QueueHandler, QueueListener
 import os
 import time
 
 # Add parent directory to path for module imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from veiculos.algoritmo_tarefas import A_star_task_algorithm
+from veiculos.algoritmo_tarefas import A_star_task_algorithm, single_task_plan
 from world.graph import Graph
 from logger_utils import MessageLogger, RouteCalculationLogger, VehicleMetricsLogger, OrderLifecycleLogger
 
+def _performative_template(performative):
+    """Build a Template matching messages with the given performative metadata."""
+    template = Template()
+    template.set_metadata("performative", performative)
+    return template
+
+
+# Message templates shared by every vehicle (templates are only read when matching)
+# Order proposals from warehouses (FIPA propose)
+_ORDER_TEMPLATE = _performative_template("order-proposal")
+# Confirmations from warehouses (FIPA confirm)
+_CONFIRMATION_TEMPLATE = _performative_template("order-confirmation")
+# Messages from event agent (tick, arrival, transit) (FIPA inform)
+_EVENT_TEMPLATE = _performative_template("inform")
+# Presence information queries (FIPA query)
+_PRESENCE_INFO_TEMPLATE = _performative_template("presence-info")
+# Pickup confirmations from suppliers and delivery confirmations from
+# warehouses/stores (FIPA inform)
+_PICKUP_CONFIRM_TEMPLATE = _performative_template("pickup-confirm")
+_DELIVERY_CONFIRM_TEMPLATE = _performative_template("delivery-confirm")
+_ACK_TEMPLATE = _PICKUP_CONFIRM_TEMPLATE | _DELIVERY_CONFIRM_TEMPLATE
+
+# How long an idle behaviour waits for a message before run() returns. A message
+# wakes the behaviour immediately, so this only sets how often idle vehicles
+# poll; a short timeout means several wakeups per second per vehicle for nothing.
+_IDLE_RECEIVE_TIMEOUT = 10
+
+# Body of the per-tick time update sent to the event agent. Only the location,
+# next node and time change, so the JSON is filled in directly instead of
+# building and encoding a dictionary (see MovementBehaviour.notify_event_agent)
+_TIME_UPDATE_BODY = '{{"type":"arrival","vehicle_id":"{}","current_location":{},"next_node":{},"time":{}}}'
+
+# Fields every order-proposal body must carry
+_REQUIRED_ORDER_FIELDS = frozenset({"product", "quantity", "orderid", "sender", "receiver",
+                                    "sender_location", "receiver_location"})
+
+# orjson is optional: it encodes straight to bytes and is several times faster
+# than json for the small state dicts the vehicle sends
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data):
+    """Serialize a flat message dictionary to a JSON string.
+    
+    Uses orjson when it is installed. orjson writes NaN/Infinity as null, while
+    receivers rely on json's Infinity (e.g. an infeasible delivery_time), so
+    dictionaries holding a non-finite float are encoded with json instead.
+    """
+    if orjson is not None and all(not isinstance(value, float) or math.isfinite(value)
+                                  for value in data.values()):
+        return orjson.dumps(data).decode()
+    return json.dumps(data)
+
+
+def _loads(body):
+    """Parse a JSON message body, using orjson when it is installed.
+    
+    orjson rejects the NaN/Infinity literals that json emits, so bodies it
+    cannot parse are handed to json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(body)
+
+
+# Maximum number of A* plans kept per vehicle (least recently used are dropped)
+_ASTAR_CACHE_SIZE = 1024
+
+# Guards every read and write of the vehicles' A* plan caches: searches run both
+# in worker threads (proposals) and on the event loop (route recalculation), so
+# the LRU bookkeeping must not interleave. Held only around dictionary updates,
+# never during a search.
+_ASTAR_CACHE_LOCK = threading.Lock()
+
+def _solve_tasks(cache, graph, start, orders, capacity, max_fuel):
+    """A_star_task_algorithm() memoized in a caller-owned LRU dictionary.
+    
+    The key holds everything the search result depends on: graph version, start
+    node, the (orderid, sender, receiver, quantity) of every order, capacity and
+    fuel. Routes are stored as tuples and returned as fresh deques, since callers
+    consume them from the front. At most _ASTAR_CACHE_SIZE plans are kept, and
+    the cache is only touched under _ASTAR_CACHE_LOCK.
+    
+    Args:
+        cache (OrderedDict | None): Memo dictionary (None disables caching).
+        graph (Graph): Transportation network.
+        start (int): Start node ID.
+        orders (list[Order]): Orders to plan.
+        capacity (int): Vehicle load capacity.
+        max_fuel (int): Vehicle fuel capacity.
+    
+    Returns:
+        tuple: (path, total_time) as the first two values of A_star_task_algorithm().
+    """
+    key = (graph.version, start,
+           tuple(sorted((o.orderid, o.sender_location, o.receiver_location, o.quantity) for o in orders)),
+           capacity, max_fuel)
+    entry = None
+    if cache is not None:
+        with _ASTAR_CACHE_LOCK:
+            entry = cache.get(key)
+            if entry is not None:
+                cache.move_to_end(key)
+    if entry is None:
+        path, total_time, _ = A_star_task_algorithm(graph, start, orders, capacity, max_fuel)
+        entry = (tuple(path) if path is not None else None), total_time
+        if cache is not None:
+            with _ASTAR_CACHE_LOCK:
+                cache[key] = entry
+                while len(cache) > _ASTAR_CACHE_SIZE:
+                    cache.popitem(last=False)
+    path, total_time = entry
+    return (deque(path) if path is not None else None), total_time
+
+# Parent of the per-vehicle loggers used for hot-path debug output (movement,
+# presence queries, notifications); each vehicle logs to stdout, at DEBUG level
+# when verbose and INFO otherwise
+logger = logging.getLogger(__name__)
+
+# Queue handler shared by the vehicle loggers, see _stdout_queue_handler()
+_queue_handler = None
+
+
+def _stdout_queue_handler():
+    """Return the handler that hands vehicle log output to a writer thread.
+    
+    Records are only put on a queue in the agent's event loop; a single
+    QueueListener thread, shared by all vehicles and started on first use,
+    formats them and writes them to stdout. The listener is stopped (and the
+    queue flushed) at interpreter exit.
+    """
+    global _queue_handler
+    if _queue_handler is None:
+        records = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        listener = QueueListener(records, stream_handler)
+        listener.start()
+        atexit.register(listener.stop)
+        _queue_handler = QueueHandler(records)
+    return _queue_handler
+
 
 class Order:
     """
@@ -86,8 +244,9 @@ class Order:
         receiver (str): JID of the receiving agent (destination store or warehouse).
         deliver_time (float | None): Estimated delivery time calculated via Dijkstra algorithm.
             Initially None, populated by time_to_deliver() method.
-        route (list[Node] | None): Path of nodes from sender to receiver.
-            Initially None, populated by time_to_deliver() method.
+        route (array[int] | None): Node IDs of the path from sender to receiver,
+            stored as a compact array('i'). Initially None, populated by
+            time_to_deliver() method.
         sender_location (int | None): ID of the source node in the graph.
             Initially None, set when order is created or calculated.
         receiver_location (int | None): ID of the destination node in the graph.
@@ -119,8 +278,13 @@ class Order:
     Note:
         The 'comecou' attribute (Portuguese for "started") is used to distinguish
         between orders awaiting pickup and orders currently being delivered.
+        Orders use __slots__ (one is built for every proposal, most of which are
+        rejected); use to_dict() instead of __dict__ to serialize them.
     """
     
+    __slots__ = ('product', 'quantity', 'sender', 'receiver', 'deliver_time', 'route',
+                 'sender_location', 'receiver_location', 'orderid', 'fuel', 'comecou')
+    
     def __init__(self, product:str, quantity:int, orderid:int, sender:str, receiver:str):
         """
         Initializes a new delivery order.
@@ -158,8 +322,39 @@ class Order:
                 f"sender={self.sender}, receiver={self.receiver}, "
                 f"sender_loc={self.sender_location}, receiver_loc={self.receiver_location}, "
                 f"time={self.deliver_time}, fuel={self.fuel}, started={self.comecou})")
+    
+    def to_dict(self):
+        """
+        Returns the order's attributes as a JSON-serializable dictionary.
+        
+        Replaces ``order.__dict__``, which slotted instances do not have. The
+        route is converted to a list of node IDs.
         
-    def time_to_deliver(self,sender_location:int,receiver_location:int ,map: Graph,weight: float, current_location:int,capacity:int, max_fuel: int):
+        Returns:
+            dict: Mapping from attribute name to value for every slot.
+        """
+        data = {name: getattr(self, name) for name in self.__slots__}
+        if data['route'] is not None:
+            data['route'] = list(data['route'])
+        return data
+    
+    def clone(self):
+        """
+        Returns a shallow copy of the order.
+        
+        Use this instead of copy.deepcopy() when simulating changes to an order.
+        The route array is shared, which is safe because time_to_deliver()
+        replaces it instead of mutating it.
+        
+        Returns:
+            Order: New Order with the same attribute values.
+        """
+        other = Order.__new__(Order)
+        for name in self.__slots__:
+            setattr(other, name, getattr(self, name))
+        return other
+        
+    def time_to_deliver(self,sender_location:int,receiver_location:int ,map: Graph,weight: float, current_location:int,capacity:int, max_fuel: int, astar_cache: dict = None):
         """
         Calculates delivery time, route, and required fuel using Dijkstra and A* algorithms.
         
@@ -178,10 +373,12 @@ class Order:
             current_location: Current position of the vehicle in the graph.
             capacity: Maximum load capacity of the vehicle (units).
             max_fuel: Maximum fuel capacity of the vehicle.
+            astar_cache: Optional A* memo dictionary of the evaluating vehicle
+                (see Veiculo.plan_tasks). Defaults to None (no caching).
         
         Side Effects:
             Modifies the following instance attributes:
-            - self.route: List of Node objects representing the path.
+            - self.route: Node IDs of the path, as array('i').
             - self.deliver_time: Total travel time in seconds (optimized by A*).
             - self.fuel: Amount of fuel required for the route.
             - self.sender_location: Copy of sender_location argument.
@@ -198,7 +395,7 @@ class Order:
             ...     capacity=50,
             ...     max_fuel=100
             ... )
-            >>> print(order.route)  # [Node(3), Node(5), Node(7)]
+            >>> print(order.route)  # array('i', [3, 5, 7])
             >>> print(order.deliver_time)  # 45.2
         
         Note:
@@ -206,20 +403,49 @@ class Order:
             extensions that consider vehicle weight in fuel consumption.
             The final deliver_time is optimized by A* and may differ from
             the raw Dijkstra time calculation.
+            Dijkstra results are memoized by the graph per version (see
+            Graph.apsp_route_ids).
+            Orders whose nodes are in different connected components get
+            deliver_time = inf. Orders picked up and delivered at the same node
+            skip both searches: deliver_time is the trip to the pickup point, or
+            inf if the order fails the planner's capacity or fuel checks.
         """
-        # Calculate delivery time based on the map using Dijkstra
-        path, fuel, dijkstra_time = map.djikstra(int(sender_location), int(receiver_location))
-        self.route = path
+        # Degenerate orders need no search: no road at all between the nodes, or
+        # nothing to carry between them
+        if not (map.same_component(int(sender_location), int(receiver_location))
+                and map.same_component(int(current_location), int(sender_location))):
+            self.route = None
+            self.fuel = 0.0
+            self.deliver_time = math.inf
+            self.sender_location = sender_location
+            self.receiver_location = receiver_location
+            return
+        if int(sender_location) == int(receiver_location):
+            self.route = array('i', [int(sender_location)])
+            self.fuel = 0.0
+            self.sender_location = sender_location
+            self.receiver_location = receiver_location
+            # Only the trip to the pickup point remains, planned under the same
+            # capacity and fuel checks as any other single order
+            plan = single_task_plan(map, int(current_location),
+                                    (int(sender_location), int(receiver_location), self.quantity, self.orderid),
+                                    capacity, max_fuel)
+            self.deliver_time = plan[1] if plan is not None else math.inf
+            return
+        
+        # Calculate delivery time based on the map using Dijkstra (memoized by the
+        # graph per version, since many proposals share the same endpoints)
+        path, fuel, dijkstra_time = map.apsp_route_ids(int(sender_location), int(receiver_location))
+        self.route = array('i', path) if path is not None else None
         self.deliver_time = dijkstra_time
         self.fuel = fuel
         self.sender_location = sender_location
         self.receiver_location = receiver_location
         
         # Optimize delivery time using A* task algorithm
-        import time as time_module
-        start_time = time_module.time()
-        _ , optimized_time , _ = A_star_task_algorithm(map, current_location, [self], capacity, max_fuel)
-        computation_time_ms = (time_module.time() - start_time) * 1000
+        start_time = time.time()
+        _ , optimized_time = _solve_tasks(astar_cache, map, current_location, [self], capacity, max_fuel)
+        computation_time_ms = (time.time() - start_time) * 1000
         
         self.deliver_time = optimized_time
         
@@ -261,10 +487,9 @@ class Veiculo(Agent):
             Implements FIPA inform protocol by receiving event agent updates.
         - PresenceInfoBehaviour: Responds to presence information requests.
             Implements FIPA query protocol for vehicle status queries.
-        - ReceivePickupConfirmation: Receives pickup confirmations from suppliers.
-            Implements FIPA inform protocol for pickup acknowledgments.
-        - ReceiveDeliveryConfirmation: Receives delivery confirmations from stores.
-            Implements FIPA inform protocol for delivery acknowledgments.
+        - ReceiveConfirmationsBehaviour: Receives pickup confirmations from
+            suppliers and delivery confirmations from stores.
+            Implements FIPA inform protocol for pickup/delivery acknowledgments.
     
     FIPA Communication Protocol:
         1. Order Proposal (FIPA propose):
@@ -291,12 +516,12 @@ class Veiculo(Agent):
         current_load (int): Current load being transported.
         max_orders (int): Maximum number of simultaneous orders allowed.
         weight (float): Vehicle weight (affects fuel consumption).
-        orders (list[Order]): Active orders being executed in current route.
+        orders (dict[int, Order]): Active orders being executed in current route, by orderid.
         map (Graph): Graph representing the transportation network.
         current_location (int): ID of the node where vehicle is currently located.
         next_node (int | None): ID of the next destination node in the route.
         fuel_to_next_node (float): Fuel required to reach the next node.
-        actual_route (list[tuple[int, int]]): Current route as list of (node_id, order_id) tuples.
+        actual_route (deque[tuple[int, int]]): Current route as deque of (node_id, order_id) tuples.
         pending_orders (list[Order]): Orders accepted but not yet started.
         time_to_finish_task (float): Estimated time to complete current route.
         pending_confirmations (dict): Orders awaiting warehouse confirmation.
@@ -304,6 +529,8 @@ class Veiculo(Agent):
             Value: dict with {order, can_fit, delivery_time, sender_jid}
         event_agent_jid (str): JID of the event coordination agent.
         verbose (bool): Enable detailed logging output.
+        logger (logging.Logger): Per-vehicle logger written to stdout; debug
+            messages are only emitted when verbose.
     
     Example:
         >>> from world.graph import Graph
@@ -356,6 +583,10 @@ class Veiculo(Agent):
             The max_orders parameter is defined but not currently enforced in the logic.
         """
         super().__init__(jid, password)
+        # JID as sent in message bodies, formatted once
+        self._jid_str = str(self.jid)
+        # JID of the supplier at each supplier node, filled in setup()
+        self._supplier_jids = {}
 
         self.max_fuel = max_fuel
         self.capacity = capacity
@@ -363,21 +594,260 @@ class Veiculo(Agent):
         self.current_load = 0
         self.max_orders = max_orders
         self.weight = weight
-        self.orders = []
+        self.orders = {}  # orderid -> Order
         self.map = map
         self.current_location = current_location 
         self.next_node= None
         self.fuel_to_next_node= 0
-        self.actual_route = []  # List of tuples (node_id, order_id)
+        self.actual_route = deque()  # Tuples (node_id, order_id), consumed from the front
         self.pending_orders = []
         self.time_to_finish_task = 0
         self.event_agent_jid = event_agent_jid
         self.verbose = verbose
         
+        # Debug messages use lazy %-formatting, so they cost nothing unless verbose;
+        # records are written to stdout by a background thread
+        self.logger = logger.getChild(str(jid))
+        self.logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+        # Warnings are written to stdout like the rest of the vehicle output, also
+        # when not verbose (without a handler they would reach stderr through
+        # logging's last-resort handler)
+        if not self.logger.handlers:
+            self.logger.addHandler(_stdout_queue_handler())
+            self.logger.propagate = False
+        
         # Dictionary to store multiple orders awaiting confirmation
         # Key: orderid, Value: dict with order, can_fit, delivery_time, sender_jid
         self.pending_confirmations = {}
+        # Set while pending_confirmations is non-empty; maintained by
+        # _add_pending_confirmation and _remove_pending_confirmation
+        self._pending_confirmations_event = asyncio.Event()
+        
+        # Last (presence_type, show, status) set through update_presence()
+        self._cached_presence = (None, None, None)
+        
+        # Memoized A* task plans (LRU), see plan_tasks(); cleared when the vehicle moves
+        self._astar_cache = OrderedDict()
+        
+        # All-pairs shortest-path trees, shared by every agent using this map
+        self.map.compute_apsp()
+        
+        # Sizes of orders and pending_orders, kept in step at every mutation site
+        self._active_orders_count = 0
+        self._pending_orders_count = 0
+        # Counter bumped on every change of orders, maintained by _add_order,
+        # _remove_order and _set_orders
+        self._orders_version = 0
+        
+        # Node route to the next stop, kept across ticks by update_location_and_time
+        # and valid for _cached_route_key = (target node, graph version)
+        self._cached_route = []
+        self._cached_route_cum = [0]
+        self._cached_route_idx = 0
+        self._cached_route_key = None
+        
+        # Serialized presence-response body, valid while _presence_json_key
+        # (the tuple of reported fields) is unchanged
+        self._presence_json_cache = None
+        self._presence_json_key = None
+        
+        # Parallel (nodes, order_ids, cumulative times) view of actual_route,
+        # valid for _route_profile_key = (graph version, route contents)
+        self._route_profile = ([], [], [0])
+        self._route_profile_key = None
+        # Travel time of each segment of the route in _route_profile_key
+        self._route_segment_times = []
+        # Positions of every node ID in that route, for membership and index lookups
+        self._route_node_positions = {}
+        # Load along actual_route, valid for _load_profile_key = (route profile
+        # key, current load, _orders_version)
+        self._load_profile = ([0], [], [-math.inf], 0)
+        self._load_profile_key = None
+
 
+    def _add_order(self, order):
+        """Adds an accepted order to the current orders."""
+        self.orders[order.orderid] = order
+        self._active_orders_count = len(self.orders)
+        self._orders_version += 1
+
+    def _remove_order(self, order):
+        """Removes a delivered order from the current orders."""
+        del self.orders[order.orderid]
+        self._active_orders_count = len(self.orders)
+        self._orders_version += 1
+
+    def _set_orders(self, orders):
+        """Replaces the current orders with a list of orders (e.g. the pending ones)."""
+        self.orders = {order.orderid: order for order in orders}
+        self._active_orders_count = len(self.orders)
+        self._orders_version += 1
+
+    def _add_pending_confirmation(self, orderid, info):
+        """Records a proposal awaiting the warehouse's decision and wakes WaitConfirmationBehaviour."""
+        self.pending_confirmations[orderid] = info
+        self._pending_confirmations_event.set()
+
+    def _remove_pending_confirmation(self, orderid):
+        """Drops a decided proposal; WaitConfirmationBehaviour sleeps once none are left."""
+        del self.pending_confirmations[orderid]
+        if not self.pending_confirmations:
+            self._pending_confirmations_event.clear()
+
+    def plan_tasks(self, start, orders):
+        """
+        Plans the pickup/delivery sequence for a set of orders, memoized.
+        
+        Wraps A_star_task_algorithm() with the vehicle's capacity and fuel limits.
+        During a negotiation round the same order set is planned several times
+        (time_to_deliver, can_fit_in_current_route, the future-route estimate),
+        so results are cached in self._astar_cache by graph version, start node
+        and order contents, keeping the _ASTAR_CACHE_SIZE most recently used.
+        
+        Args:
+            start: Node ID the plan starts from.
+            orders: List of Order objects to plan.
+        
+        Returns:
+            tuple: (route, total_time) where route is a new deque of (node_id,
+                order_id) tuples (None if infeasible) and total_time its duration.
+        """
+        return _solve_tasks(self._astar_cache, self.map, start, orders, self.capacity, self.max_fuel)
+
+    def plan_route(self, start, orders):
+        """
+        Plans a route for a set of orders and logs the calculation.
+        
+        Single entry point for the route searches of the vehicle's behaviours
+        (proposal evaluation, future-route estimates, route recalculation after
+        a confirmation or when pending orders are started). Plain function, so it
+        can also run through asyncio.to_thread.
+        
+        Args:
+            start: Node ID the route starts from.
+            orders: List of Order objects to plan.
+        
+        Returns:
+            tuple: (route, total_time) as returned by plan_tasks().
+        """
+        start_time = time.time()
+        route, total_time = self.plan_tasks(start, orders)
+        
+        # Log route calculation
+        try:
+            computation_time_ms = (time.time() - start_time) * 1000
+            route_logger = RouteCalculationLogger.get_instance()
+            route_logger.log_calculation(
+                vehicle_jid=self._jid_str,
+                algorithm="astar",
+                num_orders=len(orders),
+                computation_time_ms=computation_time_ms,
+                route_length=len(route) if route else 0,
+                total_distance=total_time,
+                route_nodes=str([node_id for node_id, _ in route]) if route else "[]"
+            )
+        except Exception:
+            pass
+        
+        return route, total_time
+
+    def route_profile(self):
+        """
+        Returns actual_route split into parallel arrays, with arrival times.
+        
+        Route simulations read node IDs, order IDs and the travel time from the
+        first stop to each stop. Keeping them as three flat lists, rebuilt only
+        when the route or the graph changes, avoids unpacking the tuples and
+        querying the shortest path of every segment on each proposal. When the
+        vehicle has only consumed stops from the front of the route, the known
+        segment times are reused instead of being looked up again.
+        
+        Returns:
+            tuple: (nodes, order_ids, cumulative_times) where cumulative_times[i]
+                is the travel time from actual_route[0] to actual_route[i].
+        
+        Note:
+            self._route_node_positions maps every node of the same route to
+            the ascending list of its positions in it.
+        """
+        route = tuple(self.actual_route)
+        key = (self.map.version, route)
+        old_key = self._route_profile_key
+        if key != old_key:
+            nodes = [node_id for node_id, _ in route]
+            order_ids = [order_id for _, order_id in route]
+            consumed = len(old_key[1]) - len(route) if old_key is not None else -1
+            if route and consumed >= 0 and old_key[0] == key[0] and old_key[1][consumed:] == route:
+                # Stops were popped from the front: keep the remaining segments
+                segment_times = self._route_segment_times[consumed:]
+            else:
+                segment_times = [self.map.apsp_route(prev_node_id, node_id)[2]
+                                 for prev_node_id, node_id in zip(nodes, nodes[1:])]
+            self._route_segment_times = segment_times
+            positions = {}
+            for i, node_id in enumerate(nodes):
+                positions.setdefault(node_id, []).append(i)
+            self._route_node_positions = positions
+            self._route_profile = (nodes, order_ids, list(accumulate(segment_times, initial=0)))
+            self._route_profile_key = key
+        return self._route_profile
+
+    def load_profile(self):
+        """
+        Returns the vehicle load along actual_route from the current orders.
+        
+        Computed once per route, load and order set (i.e. when a route is
+        adopted or advanced) and shared by every proposal evaluated meanwhile,
+        so checking a new order for overflow reduces to a few lookups.
+        
+        Returns:
+            tuple: (loads, pickup_loads, peak_before, peak_load) where loads[i]
+                is the load before step i (loads[i + 1] after it), pickup_loads[i]
+                the load after step i if it picks up an existing order (-inf
+                otherwise), peak_before[i] the maximum of pickup_loads[:i] and
+                peak_load the maximum load reached anywhere on the route.
+        """
+        route_nodes, route_order_ids, _ = self.route_profile()
+        key = (self._route_profile_key, self.current_load, self._orders_version)
+        if key != self._load_profile_key:
+            orders_dict = self.orders
+            deltas = []
+            pickups = []
+            for node_id, order_id in zip(route_nodes, route_order_ids):
+                existing_order = orders_dict.get(order_id) if order_id else None
+                if existing_order is not None and node_id == existing_order.sender_location:
+                    deltas.append(existing_order.quantity)
+                    pickups.append(True)
+                elif existing_order is not None and node_id == existing_order.receiver_location:
+                    deltas.append(-existing_order.quantity)
+                    pickups.append(False)
+                else:
+                    deltas.append(0)
+                    pickups.append(False)
+            loads = list(accumulate(deltas, initial=self.current_load))
+            pickup_loads = [loads[i + 1] if is_pickup else -math.inf
+                            for i, is_pickup in enumerate(pickups)]
+            peak_before = list(accumulate(pickup_loads, max, initial=-math.inf))
+            self._load_profile = (loads, pickup_loads, peak_before, max(loads))
+            self._load_profile_key = key
+        return self._load_profile
+
+    def update_presence(self, presence_type, show, status=None):
+        """
+        Sets the vehicle's XMPP presence and caches it on the agent.
+        
+        All presence changes of the vehicle go through this method, so readers
+        (route feasibility checks, PresenceInfoBehaviour) take the current
+        presence from self._cached_presence instead of querying SPADE's
+        presence manager each time.
+        
+        Args:
+            presence_type: PresenceType to announce (e.g. AVAILABLE).
+            show: PresenceShow to announce (CHAT = available, AWAY = busy).
+            status: Optional human-readable status message.
+        """
+        self.presence.set_presence(presence_type=presence_type, show=show, status=status)
+        self._cached_presence = (presence_type, show, status)
 
     async def setup(self):
         """
@@ -386,20 +856,19 @@ class Veiculo(Agent):
         This method is automatically called by SPADE when the agent starts. It configures:
         - XMPP presence (accepts all contacts, status AVAILABLE/CHAT)
         - Message templates for filtering communication types (following FIPA-ACL)
-        - Six cyclic behaviours with specific templates for different message types
+        - Five cyclic behaviours with specific templates for different message types
         
-        Message Templates Created (FIPA-ACL Performatives):
-            - order_template: Filters "order-proposal" messages from warehouses.
+        Message Templates Used (FIPA-ACL Performatives, built once at module import):
+            - _ORDER_TEMPLATE: Filters "order-proposal" messages from warehouses.
                 Uses FIPA propose performative for contract negotiation.
-            - confirmation_template: Filters "order-confirmation" messages.
+            - _CONFIRMATION_TEMPLATE: Filters "order-confirmation" messages.
                 Uses FIPA confirm performative for agreement finalization.
-            - event_template: Filters "inform" messages from event agent.
+            - _EVENT_TEMPLATE: Filters "inform" messages from event agent.
                 Uses FIPA inform performative for status updates.
-            - inform_template: Filters "presence-info" query messages.
+            - _PRESENCE_INFO_TEMPLATE: Filters "presence-info" query messages.
                 Uses FIPA query performative for information requests.
-            - pickup_confirm_template: Filters "pickup-confirm" from suppliers.
-                Uses FIPA inform performative for acknowledgments.
-            - delivery_confirm_template: Filters "delivery-confirm" from stores.
+            - _ACK_TEMPLATE: Filters "pickup-confirm" from suppliers or
+                "delivery-confirm" from stores.
                 Uses FIPA inform performative for acknowledgments.
         
         Side Effects:
@@ -407,53 +876,37 @@ class Veiculo(Agent):
             - Adds WaitConfirmationBehaviour for processing confirmations.
             - Adds MovementBehaviour for processing time/movement events.
             - Adds PresenceInfoBehaviour for responding to status queries.
-            - Adds ReceivePickupConfirmation for supplier acknowledgments.
-            - Adds ReceiveDeliveryConfirmation for store acknowledgments.
+            - Adds ReceiveConfirmationsBehaviour for supplier and store acknowledgments.
             - Sets presence as AVAILABLE/CHAT (available for orders).
         
         Note:
             Template filtering prevents behaviours from processing incorrect messages,
             ensuring clean separation of concerns following FIPA-ACL protocol standards.
         """
-        from spade.template import Template
-        
         self.presence.approve_all=True
-        self.presence.set_presence(presence_type=PresenceType.AVAILABLE,
-                                   show=PresenceShow.CHAT)
-        
-        print(f"[{self.name}] Vehicle agent setup complete. Presence: AVAILABLE/CHAT")
-        
-        # Template to receive order proposals from warehouses (FIPA propose)
-        order_template = Template()
-        order_template.set_metadata("performative", "order-proposal")
-        
-        # Template to receive confirmations from warehouses (FIPA confirm)
-        confirmation_template = Template()
-        confirmation_template.set_metadata("performative", "order-confirmation")
-        
-        # Template to receive messages from event agent (tick, arrival, transit) (FIPA inform)
-        event_template = Template()
-        event_template.set_metadata("performative", "inform")
-
-        # Template to receive presence information queries (FIPA query)
-        inform_template = Template()
-        inform_template.set_metadata("performative", "presence-info")
-        
-        # Template to receive pickup confirmations from suppliers (FIPA inform)
-        pickup_confirm_template = Template()
-        pickup_confirm_template.set_metadata("performative", "pickup-confirm")
-        
-        # Template to receive delivery confirmations from warehouses/stores (FIPA inform)
-        delivery_confirm_template = Template()
-        delivery_confirm_template.set_metadata("performative", "delivery-confirm")
+        self.update_presence(presence_type=PresenceType.AVAILABLE,
+                             show=PresenceShow.CHAT)
         
         # Add cyclic behaviours with templates
-        self.add_behaviour(self.ReceiveOrdersBehaviour(), template=order_template)
-        self.add_behaviour(self.WaitConfirmationBehaviour(), template=confirmation_template)
-        self.add_behaviour(self.MovementBehaviour(), template=event_template)
-        self.add_behaviour(self.PresenceInfoBehaviour(),template=inform_template)
-        self.add_behaviour(self.ReceivePickupConfirmation(),template=pickup_confirm_template)
-        self.add_behaviour(self.ReceiveDeliveryConfirmation(),template=delivery_confirm_template)
+        self.add_behaviour(self.ReceiveOrdersBehaviour(), template=_ORDER_TEMPLATE)
+        self.add_behaviour(self.WaitConfirmationBehaviour(), template=_CONFIRMATION_TEMPLATE)
+        self.add_behaviour(self.MovementBehaviour(), template=_EVENT_TEMPLATE)
+        self.add_behaviour(self.PresenceInfoBehaviour(),template=_PRESENCE_INFO_TEMPLATE)
+        self.add_behaviour(self.ReceiveConfirmationsBehaviour(),template=_ACK_TEMPLATE)
+        
+        # Precompute routes between facilities (and the start node) once, so route
+        # lookups during movement are dictionary hits instead of Dijkstra runs
+        facility_nodes = [node_id for node_id, node in self.map.nodes.items()
+                          if getattr(node, "warehouse", False)
+                          or getattr(node, "supplier", False)
+                          or getattr(node, "store", False)]
+        facility_nodes.append(self.current_location)
+        self.map.precompute_matrix(facility_nodes)
+        
+        # Suppliers are addressed by location when an order is picked up
+        self._supplier_jids = {node_id: f"supplier{node_id}@localhost"
+                               for node_id, node in self.map.nodes.items()
+                               if getattr(node, "supplier", False)}
 
 
     class ReceiveOrdersBehaviour(CyclicBehaviour):
@@ -500,95 +953,128 @@ class Veiculo(Agent):
             - Does not accept orders here - only analyzes and proposes
             - WaitConfirmationBehaviour processes the final warehouse decision
             - Invalid messages (missing fields) are silently ignored
+            - Orders larger than the vehicle capacity are answered with
+              can_fit=False and an infinite delivery time without running A*
+            - Route searches run through asyncio.to_thread so they do not block
+              the event loop shared by all agents
         """
 
         async def run(self):
             """
             Main execution loop for receiving and processing order proposals.
             
-            Continuously receives messages with order proposals, validates them,
-            calculates feasibility, and sends proposals back to warehouses.
+            Waits for one proposal, then drains every proposal already queued
+            (e.g. a burst broadcast by several warehouses) and evaluates them in
+            one tick, so they share the same vehicle state and route caches.
             """
-            msg = await self.receive(timeout=1)
-            if msg:
-                order_data = json.loads(msg.body)
-                
-                # Validate required fields
-                required_fields = ["product", "quantity", "orderid", "sender", "receiver", 
-                                    "sender_location", "receiver_location"]
-                if not all(field in order_data for field in required_fields):
-                    if self.agent.verbose:
-                        print(f"[{self.agent.name}] Invalid message - missing fields: {order_data}")
-                    return
-                
-                order = Order(
-                    product=order_data["product"],
-                    quantity=order_data["quantity"],
-                    orderid=order_data["orderid"],
-                    sender=order_data["sender"],
-                    receiver=order_data["receiver"]
-                )
-                order.sender_location = order_data["sender_location"]
-                order.receiver_location = order_data["receiver_location"]
-                
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] Order received: {order}")
-                
-                # Calculate order information (route, time, fuel)
-                order.time_to_deliver(
+            msg = await self.receive(timeout=_IDLE_RECEIVE_TIMEOUT)
+            if not msg:
+                return
+            
+            batch = [msg]
+            while True:
+                queued = await self.receive(timeout=0)
+                if queued is None:
+                    break
+                batch.append(queued)
+            
+            if len(batch) > 1:
+                self.agent.logger.debug("[%s] Processing %d queued order proposals", self.agent.name, len(batch))
+            
+            for msg in batch:
+                await self.process_proposal(msg)
+        
+        async def process_proposal(self, msg):
+            """
+            Validates one order proposal, evaluates it and sends the vehicle proposal back.
+            
+            Args:
+                msg: "order-proposal" message received from a warehouse.
+            """
+            order_data = _loads(msg.body)
+            
+            # Validate required fields
+            if not _REQUIRED_ORDER_FIELDS.issubset(order_data):
+                self.agent.logger.debug("[%s] Invalid message - missing fields: %s", self.agent.name, order_data)
+                return
+            
+            order = Order(
+                product=order_data["product"],
+                quantity=order_data["quantity"],
+                orderid=order_data["orderid"],
+                sender=order_data["sender"],
+                receiver=order_data["receiver"]
+            )
+            order.sender_location = order_data["sender_location"]
+            order.receiver_location = order_data["receiver_location"]
+            
+            self.agent.logger.debug("[%s] Order received: %s", self.agent.name, order)
+            
+            # An order larger than the whole vehicle can never be planned, so skip
+            # the route optimization and reject it right away
+            if order.quantity > self.agent.capacity:
+                order.deliver_time = math.inf
+                order.fuel = 0.0
+            else:
+                # Calculate order information (route, time, fuel) in a worker
+                # thread, so the agent's other behaviours keep running meanwhile
+                await asyncio.to_thread(
+                    order.time_to_deliver,
                     sender_location=order.sender_location,
                     receiver_location=order.receiver_location,
                     map=self.agent.map,
                     weight=self.agent.weight,
                     current_location=self.agent.current_location,
                     capacity=self.agent.capacity,
-                    max_fuel=self.agent.max_fuel
-
+                    max_fuel=self.agent.max_fuel,
+                    astar_cache=self.agent._astar_cache
                 )
-                
-                # Check if order fits in current route
+            
+            # Check if order fits in current route (oversized and unreachable
+            # orders never do)
+            if math.isinf(order.deliver_time):
+                can_fit, delivery_time = False, order.deliver_time
+            else:
                 can_fit, delivery_time = await self.can_fit_in_current_route(order)
-                order.deliver_time = delivery_time
+            order.deliver_time = delivery_time
 
-                proposal_msg= Message(to=order.sender)
-                proposal_msg.set_metadata("performative", "vehicle-proposal")
-                
-                proposal_data = {
-                    "orderid": order.orderid,
-                    "can_fit": can_fit,
-                    "delivery_time": delivery_time,
-                    "vehicle_id": str(self.agent.jid)
-                }
-                proposal_msg.body = json.dumps(proposal_data)
-                await self.send(proposal_msg)
-                
-                # Log message
-                try:
-                    msg_logger = MessageLogger.get_instance()
-                    msg_logger.log_message(
-                        sender=str(self.agent.jid),
-                        receiver=str(msg.sender),
-                        message_type="vehicle-proposal",
-                        performative="vehicle-proposal",
-                        body=proposal_msg.body
-                    )
-                except Exception:
-                    pass
+            proposal_msg= Message(to=order.sender)
+            proposal_msg.set_metadata("performative", "vehicle-proposal")
+            
+            proposal_data = {
+                "orderid": order.orderid,
+                "can_fit": can_fit,
+                "delivery_time": delivery_time,
+                "vehicle_id": self.agent._jid_str
+            }
+            proposal_msg.body = _dumps(proposal_data)
+            await self.send(proposal_msg)
+            
+            # Log message
+            try:
+                msg_logger = MessageLogger.get_instance()
+                msg_logger.log_message(
+                    sender=self.agent._jid_str,
+                    receiver=str(msg.sender),
+                    message_type="vehicle-proposal",
+                    performative="vehicle-proposal",
+                    body=proposal_msg.body
+                )
+            except Exception:
+                pass
+            
+            self.agent.logger.debug("[%s] Proposal sent back to %s - Order %s: can_fit=%s, time=%s, order route=%s",
+                                    self.agent.name, msg.sender, order.orderid, can_fit, delivery_time, order.route)
                 
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] Proposal sent back to {msg.sender} - Order {order.orderid}: can_fit={can_fit}, time={delivery_time}, order route={order.route}")
-                else:
-                    print(f"[{self.agent.name}] Proposal sent back to {msg.sender}") 
-                    
-                # Store information in pending confirmations dictionary
-                self.agent.pending_confirmations[order.orderid] = {
-                    "order": order,
-                    "can_fit": can_fit,
-                    "delivery_time": delivery_time,
-                    "sender_jid": str(msg.sender)
-                }
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] Order {order.orderid} added to pending confirmations. Total: {len(self.agent.pending_confirmations)}")
+            # Store information in pending confirmations dictionary
+            self.agent._add_pending_confirmation(order.orderid, {
+                "order": order,
+                "can_fit": can_fit,
+                "delivery_time": delivery_time,
+                "sender_jid": str(msg.sender)
+            })
+            self.agent.logger.debug("[%s] Order %s added to pending confirmations. Total: %d",
+                                    self.agent.name, order.orderid, len(self.agent.pending_confirmations))
         
         async def calculate_order_info(self, order: Order):
             """
@@ -609,7 +1095,7 @@ class Veiculo(Agent):
                 - order.receiver_location: Destination
             
             Note:
-                This method is currently unused in the code (calculation done directly in run()).
+                This method is currently unused in the code (calculation done directly in process_proposal()).
             """
             path, fuel, time = await self.agent.map.djikstra(
                 int(order.sender), 
@@ -656,116 +1142,66 @@ class Veiculo(Agent):
                 ...     print(f"Order goes to pending, delivery in {time}s")
             
             Note:
-                - Route is a list of (node_id, order_id) tuples
+                - Route is a list of (node_id, order_id) tuples, read through
+                  the parallel arrays of Veiculo.route_profile()
                 - Simulates load without modifying actual vehicle state
                 - If doesn't pass through sender, calculates time with pending_orders
             """
             # Check the agent's presence state
             # CHAT = available (no tasks), AWAY = busy (with tasks)
-            presence_show = self.agent.presence.get_show()
+            presence_show = self.agent._cached_presence[1]
             
             
             # If in CHAT (available), has no active tasks
             if presence_show == PresenceShow.CHAT:
-                start_time = time.time()
-                _ , order_time, _= A_star_task_algorithm(
-                self.agent.map,
-                self.agent.current_location,
-                [new_order],
-                self.agent.capacity,
-                self.agent.max_fuel)
-                
-                # Log route calculation
-                try:
-                    computation_time_ms = (time.time() - start_time) * 1000
-                    route_logger = RouteCalculationLogger.get_instance()
-                    route_logger.log_calculation(
-                        vehicle_jid=str(self.agent.jid),
-                        algorithm="astar",
-                        num_orders=1,
-                        computation_time_ms=computation_time_ms,
-                        total_distance=order_time,
-                        route_nodes=f"order_{new_order.orderid}"
-                    )
-                except Exception:
-                    pass
-                
+                _ , order_time = await asyncio.to_thread(
+                    self.agent.plan_route, self.agent.current_location, [new_order])
                 return True, order_time
             
-            # Create a dictionary with current orders for fast access
-            orders_dict = {order.orderid: order for order in self.agent.orders}
-            
             # Check if the new order passes through any point in current route
-            route_nodes = [node_id for node_id, _ in self.agent.actual_route]
-
-            passes_through_sender = new_order.sender_location in route_nodes
+            _, _, route_times = self.agent.route_profile()
+            node_positions = self.agent._route_node_positions
+            passes_through_sender = new_order.sender_location in node_positions
             
             # If doesn't pass through sender, calculate time with pending orders
             if not passes_through_sender:
                 future_time = await self.calculate_future_delivery_time(new_order)
                 return False, future_time
             
-            # Simulate adding the order to the route
-            # Traverse current path and simulate load
-            current_load = self.agent.current_load
-            new_order_picked = False
-            new_order_delivered = False
-            delivery_time = 0
-            cumulative_time = 0
-            
-            for i, (node_id, order_id) in enumerate(self.agent.actual_route):
-                # Calculate time to this point
-                if i > 0:
-                    prev_node_id = self.agent.actual_route[i - 1][0]
-                    _, _, segment_time = self.agent.map.djikstra(prev_node_id, node_id)
-                    cumulative_time += segment_time
-                
-                # Check if it's pickup or delivery of the new order
-                if node_id == new_order.sender_location and not new_order_picked:
-                    # Try to pickup the new order
-                    test_load = current_load + new_order.quantity
-                    
-                    if test_load > self.agent.capacity:
-                        # Overflow - calculate time with pending orders
-                        future_time = await self.calculate_future_delivery_time(new_order)
-                        return False, future_time
-                    
-                    current_load = test_load
-                    new_order_picked = True
-                
-                elif node_id == new_order.receiver_location and new_order_picked and not new_order_delivered:
-                    # Deliver the new order
-                    current_load -= new_order.quantity
-                    new_order_delivered = True
-                    delivery_time = cumulative_time
-                    # Delivered the item - can stop simulating
-                    return True, delivery_time
-                
-                # Process the existing order at this point
-                if order_id and order_id in orders_dict:
-                    existing_order = orders_dict[order_id]
-                    
-                    # Check if it's pickup or delivery
-                    if node_id == existing_order.sender_location:
-                        # Pickup
-                        test_load = current_load + existing_order.quantity
-                        if test_load > self.agent.capacity:
-                            # Overflow while processing existing order
-                            future_time = await self.calculate_future_delivery_time(new_order)
-                            return False, future_time
-                        current_load = test_load
-                    elif node_id == existing_order.receiver_location:
-                        # Delivery
-                        current_load -= existing_order.quantity
-            
-            # If reached here and didn't deliver, means it didn't pass through receiver
-            # Calculate time with pending orders
-            if not new_order_delivered:
-                future_time = await self.calculate_future_delivery_time(new_order)
-                return False, future_time
-            
-            # If delivered, return success (shouldn't reach here as it returns in loop)
-            return True, delivery_time
+            # Simulate adding the order to the route on top of the load the
+            # existing orders produce at every step
+            capacity = self.agent.capacity
+            loads, pickup_loads, peak_before, peak_load = self.agent.load_profile()
+            
+            # The new order is picked up at the first visit to its sender and
+            # delivered at the next visit to its receiver
+            pickup_index = node_positions[new_order.sender_location][0]
+            receiver_positions = node_positions.get(new_order.receiver_location, ())
+            k = bisect_right(receiver_positions, pickup_index)
+            delivery_index = receiver_positions[k] if k < len(receiver_positions) else None
+            
+            quantity = new_order.quantity
+            if delivery_index is not None and peak_load + quantity <= capacity:
+                # Fits even on top of the busiest point of the route
+                return True, route_times[delivery_index]
+            
+            overflow = (
+                # Overflow while processing existing orders before the pickup
+                peak_before[pickup_index] > capacity
+                # Overflow when picking up the new order
+                or loads[pickup_index] + quantity > capacity
+            )
+            if not overflow and delivery_index is not None:
+                # Overflow while carrying the new order
+                overflow = max(pickup_loads[pickup_index:delivery_index]) + quantity > capacity
+                if not overflow:
+                    # Delivered the item - the rest of the route does not matter
+                    return True, route_times[delivery_index]
+            
+            # Overflow, or the route does not pass through the receiver after the
+            # pickup: calculate time with pending orders
+            future_time = await self.calculate_future_delivery_time(new_order)
+            return False, future_time
         
         async def calculate_future_delivery_time(self, order: Order) -> float:
             """
@@ -807,30 +1243,8 @@ class Veiculo(Agent):
             future_orders.append(order)
             
             # Calculate optimal route with A* from the last point
-            start_time = time.time()
-            route, total_time, _ = A_star_task_algorithm(
-                self.agent.map,
-                final_location,
-                future_orders,
-                self.agent.capacity,
-                self.agent.max_fuel
-            )
-            
-            # Log route calculation
-            try:
-                computation_time_ms = (time.time() - start_time) * 1000
-                route_logger = RouteCalculationLogger.get_instance()
-                route_logger.log_calculation(
-                    vehicle_jid=str(self.agent.jid),
-                    algorithm="astar",
-                    num_orders=len(future_orders),
-                    computation_time_ms=computation_time_ms,
-                    route_length=len(route) if route else 0,
-                    total_distance=total_time,
-                    route_nodes=str([node_id for node_id, _ in route]) if route else "[]"
-                )
-            except Exception:
-                pass
+            _, total_time = await asyncio.to_thread(
+                self.agent.plan_route, final_location, future_orders)
             
             # Add remaining time to finish current route
             current_route_time = self.agent.time_to_finish_task
@@ -874,8 +1288,9 @@ class Veiculo(Agent):
             - Removes order from pending_confirmations
         
         Note:
-            - Only processes if there are pending_confirmations (avoids empty loops)
-            - Timeout of 1s + sleep(0.1) to save CPU
+            - Only processes if there are pending_confirmations: while there are
+              none, the behaviour waits on an event set when one is added
+              instead of polling
         """
         
         async def run(self):
@@ -884,20 +1299,21 @@ class Veiculo(Agent):
             """
             # Only process if there are pending confirmations
             if not self.agent.pending_confirmations:
-                await asyncio.sleep(0.1)
+                await self.agent._pending_confirmations_event.wait()
                 return
             
             # Try to receive confirmation from warehouse
-            msg = await self.receive(timeout=1)
+            msg = await self.receive(timeout=_IDLE_RECEIVE_TIMEOUT)
+            log = self.agent.logger
             
             if msg:
                 try:
-                    data = json.loads(msg.body)
+                    data = _loads(msg.body)
                     orderid = data.get("orderid")
                     
                     # Check if this order is in pending confirmations
                     if orderid not in self.agent.pending_confirmations:
-                        print(f"[{self.agent.name}] Confirmation received for unknown order: {orderid}")
+                        log.warning("[%s] Confirmation received for unknown order: %s", self.agent.name, orderid)
                         return
                     
                     # Get pending order information
@@ -908,28 +1324,27 @@ class Veiculo(Agent):
                     
                     # Check if sender is correct
                     if str(msg.sender) != sender_jid:
-                        print(f"[{self.agent.name}] Confirmation from incorrect sender for order {orderid}")
+                        log.warning("[%s] Confirmation from incorrect sender for order %s", self.agent.name, orderid)
                         return
                     
                     confirmation = data.get("confirmed", False)
-                    print(f"[{self.agent.name}] Confirmation received for order {orderid}: {confirmation}")
+                    log.debug("[%s] Confirmation received for order %s: %s", self.agent.name, orderid, confirmation)
                     
                     # Process confirmation
                     if confirmation:
                         if can_fit:
                             # Add to orders (current route)
-                            self.agent.orders.append(order)
+                            self.agent._add_order(order)
                             await self.recalculate_route()
-                            if self.agent.verbose:
-                                print(f"[{self.agent.name}] Order {order.orderid} accepted and added to orders")
+                            log.debug("[%s] Order %s accepted and added to orders", self.agent.name, order.orderid)
                         else:
                             # Add to pending_orders (execute later)
                             self.agent.pending_orders.append(order)
-                            if self.agent.verbose:
-                                print(f"[{self.agent.name}] Order {order.orderid} accepted and added to pending_orders")
+                            self.agent._pending_orders_count += 1
+                            log.debug("[%s] Order %s accepted and added to pending_orders", self.agent.name, order.orderid)
                         
                         # Update presence to AWAY (busy with tasks)
-                        self.agent.presence.set_presence(
+                        self.agent.update_presence(
                             presence_type=PresenceType.AVAILABLE, 
                             show=PresenceShow.AWAY, 
                             status="Busy with tasks"
@@ -937,19 +1352,18 @@ class Veiculo(Agent):
                         if not self.agent.next_node and self.agent.actual_route:
                             self.agent.next_node = self.agent.actual_route[1][0]
                         
-                        if self.agent.verbose:
-                            print(f"[{self.agent.name}] Status changed to AWAY - has pending tasks")
-                            print(f"[{self.agent.name}] Current route: {self.agent.actual_route}")
+                        log.debug("[%s] Status changed to AWAY - has pending tasks", self.agent.name)
+                        log.debug("[%s] Current route: %s", self.agent.name, self.agent.actual_route)
                     else:
-                        print(f"[{self.agent.name}] Order {order.orderid} rejected by warehouse")
+                        log.debug("[%s] Order %s rejected by warehouse", self.agent.name, order.orderid)
                     
                     # Remove from pending confirmations dictionary
-                    del self.agent.pending_confirmations[orderid]
-                    if self.agent.verbose:
-                        print(f"[{self.agent.name}] Order {orderid} removed from pending confirmations. Remaining: {len(self.agent.pending_confirmations)}")
+                    self.agent._remove_pending_confirmation(orderid)
+                    log.debug("[%s] Order %s removed from pending confirmations. Remaining: %d",
+                              self.agent.name, orderid, len(self.agent.pending_confirmations))
                     
                 except (json.JSONDecodeError, KeyError) as e:
-                    print(f"[{self.agent.name}] Error processing confirmation: {e}")
+                    log.warning("[%s] Error processing confirmation: %s", self.agent.name, e)
             else:
                 pass  # No message received, wait for next cycle
         
@@ -957,117 +1371,82 @@ class Veiculo(Agent):
             """
             Recalculates the optimized route with all current orders using A*.
             
-            Identical to the method in ReceiveOrdersBehaviour. Recalculates the optimal path
-            to minimize total time considering all accepted orders.
+            Recalculates the optimal path to minimize total time considering all
+            accepted orders, through Veiculo.plan_route().
             
             Side Effects:
                 - self.agent.actual_route: Updated with new sequence
                 - self.agent.time_to_finish_task: Updated with total time
-            
-            Note:
-                Duplicated code - consider refactoring to a method of Veiculo class.
             """
             if self.agent.orders:
-                start_time_calc = time.time()
-                route, time_calc , _ = A_star_task_algorithm(
-                    self.agent.map,
-                    self.agent.current_location,
-                    self.agent.orders,
-                    self.agent.capacity,
-                    self.agent.max_fuel
-                )
-                
-                # Log route calculation
-                try:
-                    computation_time_ms = (time.time() - start_time_calc) * 1000
-                    route_logger = RouteCalculationLogger.get_instance()
-                    route_logger.log_calculation(
-                        vehicle_jid=str(self.agent.jid),
-                        algorithm="astar",
-                        num_orders=len(self.agent.orders),
-                        computation_time_ms=computation_time_ms,
-                        route_length=len(route) if route else 0,
-                        total_distance=time_calc,
-                        route_nodes=str([node_id for node_id, _ in route]) if route else "[]"
-                    )
-                except Exception:
-                    pass
+                route, time_calc = self.agent.plan_route(self.agent.current_location,
+                                                         list(self.agent.orders.values()))
                 
                 self.agent.actual_route = route
                 self.agent.time_to_finish_task = time_calc
     
-    class ReceivePickupConfirmation(CyclicBehaviour):
+    class ReceiveConfirmationsBehaviour(CyclicBehaviour):
         """
-        Cyclic behaviour to receive pickup confirmations from suppliers.
+        Cyclic behaviour to receive pickup and delivery confirmations.
         
         This behaviour processes acknowledgment messages from suppliers confirming
-        that the vehicle has successfully picked up goods. This implements the
-        FIPA inform performative for unidirectional status updates.
+        that the vehicle has picked up goods, and from destination agents
+        (warehouses or stores) confirming that goods have been delivered. Both
+        implement the FIPA inform performative for one-way notifications, so a
+        single behaviour polls the mailbox for both and dispatches on the
+        performative.
         
         FIPA Protocol Implementation:
             - Receives INFORM messages with performative="pickup-confirm"
-            - Logs confirmation for tracking and debugging purposes
-            - No response required (one-way notification)
-        
-        Expected Message Format:
-            - Metadata: performative="pickup-confirm" (FIPA INFORM)
-            - Body (JSON): {
-                "orderid": int
-              }
-        
-        Note:
-            Currently only logs the confirmation. Could be extended to update
-            internal state or trigger additional behaviours.
-        """
-        async def run(self):
-            """Main loop for receiving pickup confirmations."""
-            msg = await self.receive(timeout=1)
-            
-            if msg:
-                try:
-                    data = json.loads(msg.body)
-                    orderid = data.get("orderid")
-                    
-                    print(f"[{self.agent.name}] ✅ Pickup confirmation received from supplier {msg.sender} for order {orderid}")
-                    
-                except (json.JSONDecodeError, KeyError) as e:
-                    print(f"[{self.agent.name}] Error processing pickup confirmation: {e}")
-    
-    class ReceiveDeliveryConfirmation(CyclicBehaviour):
-        """
-        Cyclic behaviour to receive delivery confirmations from warehouses/stores.
-        
-        This behaviour processes acknowledgment messages from destination agents
-        (warehouses or stores) confirming that goods have been successfully delivered.
-        Implements FIPA inform performative for one-way notifications.
-        
-        FIPA Protocol Implementation:
-            - Receives INFORM messages with performative="delivery-confirm"
+              or performative="delivery-confirm"
             - Logs confirmation for tracking and auditing
             - No response required (acknowledgment only)
         
         Expected Message Format:
-            - Metadata: performative="delivery-confirm" (FIPA INFORM)
+            - Metadata: performative="pickup-confirm" or "delivery-confirm" (FIPA INFORM)
             - Body (JSON): {
                 "orderid": int
               }
         
         Note:
-            Currently only logs the confirmation. Could be extended to update
-            delivery statistics or trigger completion workflows.
+            Currently only logs the confirmations. Could be extended to update
+            internal state or delivery statistics.
+            Confirmations already queued behind the first one (e.g. for every
+            order handled at the same node) are processed in the same run.
         """
         async def run(self):
-            """Main loop for receiving delivery confirmations."""
-            msg = await self.receive(timeout=1)
+            """Main loop for receiving pickup and delivery confirmations."""
+            msg = await self.receive(timeout=_IDLE_RECEIVE_TIMEOUT)
             
-            if msg:
-                try:
-                    data = json.loads(msg.body)
-                    orderid = data["orderid"]
-                    print(f"[{self.agent.name}] ✅ Delivery confirmation received from {msg.sender} for order {orderid}")
-                    
-                except (json.JSONDecodeError, KeyError) as e:
-                    print(f"[{self.agent.name}] Error processing delivery confirmation: {e}")
+            while msg:
+                self._process(msg)
+                msg = await self.receive(timeout=0)
+        
+        def _process(self, msg):
+            """Dispatches one confirmation to its handler by performative."""
+            performative = msg.get_metadata("performative")
+            try:
+                data = _loads(msg.body)
+                if performative == "pickup-confirm":
+                    self._handle_pickup(data, msg)
+                elif performative == "delivery-confirm":
+                    self._handle_delivery(data, msg)
+                
+            except (json.JSONDecodeError, KeyError) as e:
+                kind = "pickup" if performative == "pickup-confirm" else "delivery"
+                self.agent.logger.warning("[%s] Error processing %s confirmation: %s", self.agent.name, kind, e)
+        
+        def _handle_pickup(self, data, msg):
+            """Handles a pickup confirmation from a supplier."""
+            orderid = data.get("orderid")
+            self.agent.logger.debug("[%s] ✅ Pickup confirmation received from supplier %s for order %s",
+                                    self.agent.name, msg.sender, orderid)
+        
+        def _handle_delivery(self, data, msg):
+            """Handles a delivery confirmation from a warehouse or store."""
+            orderid = data["orderid"]
+            self.agent.logger.debug("[%s] ✅ Delivery confirmation received from %s for order %s",
+                                    self.agent.name, msg.sender, orderid)
     
     class MovementBehaviour(CyclicBehaviour):
         """
@@ -1123,8 +1502,22 @@ class Veiculo(Agent):
             - Only processes if presence = AWAY (busy)
             - Timeout of 5s to not miss important events
             - Automatic refueling at pickups/deliveries
+            - Supplier/warehouse notifications produced while processing an
+              arrival are queued in self._outbox and sent together by
+              flush_outbox() once every task at the node is processed
         """
 
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            # Notifications waiting to be sent by flush_outbox()
+            self._outbox = []
+
+        async def flush_outbox(self):
+            """Sends every queued notification concurrently and empties the outbox."""
+            if self._outbox:
+                outbox, self._outbox = self._outbox, []
+                await asyncio.gather(*(self.send(msg) for msg in outbox))
+
         async def run(self):
             """
             Main execution loop for processing movement and arrival events.
@@ -1134,92 +1527,74 @@ class Veiculo(Agent):
             # Check if vehicle is busy (AWAY = has tasks)
 
             
-            msg = await self.receive(timeout=5)  # Longer timeout to not miss messages
+            msg = await self.receive(timeout=_IDLE_RECEIVE_TIMEOUT)
+            log = self.agent.logger
 
-            presence_show = self.agent.presence.get_show()
+            presence_show = self.agent._cached_presence[1]
             
             if presence_show == PresenceShow.CHAT:
-                print(f"[{self.agent.name}] Vehicle available - ignoring movement messages")
+                log.debug("[%s] Vehicle available - ignoring movement messages", self.agent.name)
                 # Vehicle available (no tasks) - does not process movement messages
             if msg:
-                # Print received message
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] Message received in MovementBehaviour")
-                if self.agent.verbose:
-                    print(f"  Body: {msg.body}")
-                    print(f"  Metadata: {msg.metadata}")
+                # Log received message
+                log.debug("[%s] Message received in MovementBehaviour", self.agent.name)
+                log.debug("  Body: %s", msg.body)
+                log.debug("  Metadata: %s", msg.metadata)
                     
-                data = json.loads(msg.body)
+                data = _loads(msg.body)
                 type = data.get("type")
                 event_time = data.get("time")
                 vehicles = data.get("vehicles", [])  # New vehicles list
                 
                 # Check if this vehicle is in the vehicles list
                 is_for_this_vehicle = self.agent.name in vehicles
-                if self.agent.verbose:
-                    print (f"[{self.agent.name}] is_for_this_vehicle: {is_for_this_vehicle} (vehicles={vehicles})")
+                log.debug("[%s] is_for_this_vehicle: %s (vehicles=%s)", self.agent.name, is_for_this_vehicle, vehicles)
                 if type == "arrival" and is_for_this_vehicle:
                     # Arrived at a node - process arrival
-                    self.agent.current_location, order_id = self.agent.actual_route.pop(0)
+                    self.agent.current_location, order_id = self.agent.actual_route.popleft()
                     if not order_id:
-                        self.agent.current_location, order_id = self.agent.actual_route.pop(0)
+                        self.agent.current_location, order_id = self.agent.actual_route.popleft()
+                    # Plans from the previous location will not be asked for again
+                    with _ASTAR_CACHE_LOCK:
+                        self.agent._astar_cache.clear()
                     # Process the first task at the node
                     await self.process_node_arrival(self.agent.current_location, order_id)
                     
                     # Process all consecutive equal nodes (multiple tasks at same location)
                     while self.agent.actual_route and self.agent.actual_route[0][0] == self.agent.current_location:
                         # Next item in route is at same node - process immediately
-                        next_location, next_order_id = self.agent.actual_route.pop(0)
+                        next_location, next_order_id = self.agent.actual_route.popleft()
                         await self.process_node_arrival(next_location, next_order_id)
                     
+                    # Send the pickup/delivery notifications of this node together
+                    await self.flush_outbox()
+                    
                     # Check if current route is finished
                     if not self.agent.actual_route:
                         if len(self.agent.pending_orders) == 0:
                             # No more tasks - become available
-                            self.agent.presence.set_presence(
+                            self.agent.update_presence(
                                 presence_type=PresenceType.AVAILABLE,
                                 show=PresenceShow.CHAT,
                                 status="Available for new orders"
                             )
                             
                             self.agent.next_node = None
-                            if self.agent.verbose:
-                                print(f"[{self.agent.name}] Status changed to AVAILABLE - no tasks")
-                                print(f"[{self.agent.name}] All tasks completed. Vehicle now available.")
-                                print(f"[{self.agent.name}] Presence updated to AVAILABLE {self.agent.presence.get_show()}.")
+                            log.debug("[%s] Status changed to AVAILABLE - no tasks", self.agent.name)
+                            log.debug("[%s] All tasks completed. Vehicle now available.", self.agent.name)
+                            log.debug("[%s] Presence updated to AVAILABLE %s.", self.agent.name, self.agent._cached_presence[1])
                             return 
                             
                             
                         
                         # There are pending orders - calculate new route
-                        start_time_pending = time.time()
-                        self.agent.actual_route, time_pending, _ = A_star_task_algorithm(
-                            self.agent.map, 
-                            self.agent.current_location,
-                            self.agent.pending_orders,
-                            self.agent.capacity,
-                            self.agent.max_fuel
-                        )
-                        
-                        # Log route calculation
-                        try:
-                            computation_time_ms = (time.time() - start_time_pending) * 1000
-                            route_logger = RouteCalculationLogger.get_instance()
-                            route_logger.log_calculation(
-                                vehicle_jid=str(self.agent.jid),
-                                algorithm="astar",
-                                num_orders=len(self.agent.pending_orders),
-                                computation_time_ms=computation_time_ms,
-                                route_length=len(self.agent.actual_route) if self.agent.actual_route else 0,
-                                total_distance=time_pending,
-                                route_nodes=str([node_id for node_id, _ in self.agent.actual_route]) if self.agent.actual_route else "[]"
-                            )
-                        except Exception:
-                            pass
+                        self.agent.actual_route, time_pending = self.agent.plan_route(
+                            self.agent.current_location, self.agent.pending_orders)
                         
                         # Move pending orders to orders
-                        self.agent.orders = self.agent.pending_orders.copy()
+                        self.agent._set_orders(self.agent.pending_orders.copy())
                         self.agent.pending_orders = []
+                        self.agent._pending_orders_count = 0
                         self.agent.next_node = self.agent.actual_route[1][0]
                     else:
                         # Define next node
@@ -1229,21 +1604,22 @@ class Veiculo(Agent):
                             self.agent.next_node = self.agent.actual_route[0][0]
                 elif presence_show == PresenceShow.AWAY: 
                     # Movement during transit
-                    if self.agent.verbose:
-                        print(f"[{self.agent.name}] Movement during transit")
-                        print(f"[{self.agent.name}] Available time to move: {event_time}")
-                        print(f"[{self.agent.name}] Current location before moving: {self.agent.current_location}")
+                    log.debug("[%s] Movement during transit", self.agent.name)
+                    log.debug("[%s] Available time to move: %s", self.agent.name, event_time)
+                    log.debug("[%s] Current location before moving: %s", self.agent.name, self.agent.current_location)
                     temp_location = self.agent.current_location
-                    self.agent.current_location = await self.update_location_and_time(event_time)
-                    if self.agent.verbose:
-                        print(f"[{self.agent.name}] Current location after moving: {self.agent.current_location}")
-                    _, _, simulated_time = self.agent.map.djikstra(temp_location, self.agent.current_location)
-                    if self.agent.verbose:
-                        print(f"[{self.agent.name}] Simulated time to move: {simulated_time}")
+                    new_location = await self.update_location_and_time(event_time)
+                    if new_location != self.agent.current_location:
+                        with _ASTAR_CACHE_LOCK:
+                            self.agent._astar_cache.clear()
+                    self.agent.current_location = new_location
+                    log.debug("[%s] Current location after moving: %s", self.agent.name, self.agent.current_location)
+                    if log.isEnabledFor(logging.DEBUG):
+                        _, simulated_time = self.agent.map.route_cost(temp_location, self.agent.current_location)
+                        log.debug("[%s] Simulated time to move: %s", self.agent.name, simulated_time)
                     
                 if type == "Transit":
-                    if self.agent.verbose:
-                        print("Update traffic")
+                    log.debug("Update traffic")
                     # Update map with new traffic information
                     await self.update_map(data.get("data"))
                 
@@ -1254,14 +1630,15 @@ class Veiculo(Agent):
                 if event_time == 0 and type == "Transit":
                     should_notify = False
                     #print(f"[{self.agent.name}] ⚠️  Notification ignored (time=0 and type={type}, is_for_this_vehicle={is_for_this_vehicle})")
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] should_notify: {should_notify}, next_node: {self.agent.next_node}, route: {self.agent.actual_route}")
+                log.debug("[%s] should_notify: %s, next_node: %s, route: %s", self.agent.name,
+                          should_notify, self.agent.next_node, self.agent.actual_route)
                 if should_notify and self.agent.next_node:
-                    _, _, time_left = self.agent.map.djikstra(
+                    _, time_left = self.agent.map.route_cost(
                         self.agent.current_location,
                         self.agent.next_node
                     )
-                    print(f"[{self.agent.name}] Notifying event agent from {self.agent.current_location} - time to next node ({self.agent.next_node}): {time_left}")
+                    log.debug("[%s] Notifying event agent from %s - time to next node (%s): %s", self.agent.name,
+                              self.agent.current_location, self.agent.next_node, time_left)
                     await self.notify_event_agent(time_left, self.agent.next_node)
         
         async def process_node_arrival(self, node_id: int, order_id: int):
@@ -1312,19 +1689,15 @@ class Veiculo(Agent):
                 return
             
             # Find the corresponding order
-            order = None
-            for o in self.agent.orders:
-                if o.orderid == order_id:
-                    order = o
-                    break
+            order = self.agent.orders.get(order_id)
             
             if not order:
                 return
             
             # Check if it's pickup (sender_location)
+            log = self.agent.logger
             if node_id == order.sender_location and not order.comecou:
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] PICKUP - Order {order.orderid} at {node_id}")
+                log.debug("[%s] PICKUP - Order %s at %s", self.agent.name, order.orderid, node_id)
                 
                 # Update load
                 self.agent.current_load += order.quantity
@@ -1336,13 +1709,12 @@ class Veiculo(Agent):
                 order.comecou = True
                 
                 # Change status to AWAY (busy with task)
-                self.agent.presence.set_presence(
+                self.agent.update_presence(
                     presence_type=PresenceType.AVAILABLE,
                     show=PresenceShow.AWAY,
                     status=f"Delivering order {order.orderid}"
                 )
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] Status changed to AWAY - processing order {order.orderid}")
+                log.debug("[%s] Status changed to AWAY - processing order %s", self.agent.name, order.orderid)
                 
                 # Notify supplier that pickup was made
                 await self.notify_supplier_pickup(order)
@@ -1352,8 +1724,7 @@ class Veiculo(Agent):
                 
             # Check if it's delivery (receiver_location)
             elif node_id == order.receiver_location and order.comecou:
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] DELIVERY - Order {order.orderid} at {node_id}")
+                log.debug("[%s] DELIVERY - Order %s at %s", self.agent.name, order.orderid, node_id)
                 
                 # Update load
                 self.agent.current_load -= order.quantity
@@ -1362,7 +1733,7 @@ class Veiculo(Agent):
                 self.agent.current_fuel = self.agent.max_fuel
                 
                 # Remove order from list
-                self.agent.orders.remove(order)
+                self.agent._remove_order(order)
                 
                 # Notify warehouse that delivery was completed
                 await self.notify_warehouse_complete(order)
@@ -1386,18 +1757,21 @@ class Veiculo(Agent):
             Note:
                 The order sender is the warehouse, but pickup is at the supplier.
                 We need to identify the supplier by location.
+                The message is queued and sent by flush_outbox().
             """
             # The order sender is the warehouse, but pickup is at the supplier
             # We need to identify the supplier by location
             supplier_location = order.sender_location
             
-            # Build supplier JID based on location
-            supplier_jid = f"supplier{supplier_location}@localhost"
+            # Supplier JID based on location (built once per supplier in setup)
+            supplier_jid = self.agent._supplier_jids.get(supplier_location)
+            if supplier_jid is None:
+                supplier_jid = f"supplier{supplier_location}@localhost"
             
             msg = Message(to=supplier_jid)
             msg.set_metadata("performative", "vehicle-pickup")
             msg.set_metadata("supplier_id", supplier_jid)
-            msg.set_metadata("vehicle_id", str(self.agent.jid))
+            msg.set_metadata("vehicle_id", self.agent._jid_str)
             msg.set_metadata("order_id", str(order.orderid))
             
             order_dict = {
@@ -1409,13 +1783,13 @@ class Veiculo(Agent):
                 "sender_location": order.sender_location,
                 "receiver_location": order.receiver_location
             }
-            msg.body = json.dumps(order_dict)
-            await self.send(msg)
+            msg.body = _dumps(order_dict)
+            self._outbox.append(msg)
             # Log message
             try:
                 msg_logger = MessageLogger.get_instance()
                 msg_logger.log_message(
-                    sender=str(self.agent.jid),
+                    sender=self.agent._jid_str,
                     receiver=str(msg.to),
                     message_type="Notify",
                     performative="vehicle-pickup",
@@ -1423,14 +1797,15 @@ class Veiculo(Agent):
                 )
             except Exception:
                 pass  # Don't crash on logging errors
-            print(f"[{self.agent.name}] Notified supplier {supplier_jid}: pickup order {order.orderid}")
+            self.agent.logger.debug("[%s] Notified supplier %s: pickup order %s",
+                                    self.agent.name, supplier_jid, order.orderid)
         
         async def notify_warehouse_start(self, order: Order):
             """
             Notifies the warehouse that the order started being processed (pickup made).
             
             Sends a FIPA-ACL message to the sending warehouse informing that the vehicle
-            picked up the load and started delivery.
+            picked up the load and started delivery (queued, see flush_outbox()).
             
             Args:
                 order: Order that was started.
@@ -1451,16 +1826,16 @@ class Veiculo(Agent):
             
             data = {
                 "orderid": order.orderid,
-                "vehicle_id": str(self.agent.jid),
+                "vehicle_id": self.agent._jid_str,
                 "status": "started",
                 "location": self.agent.current_location,
                 }
-            msg.body = json.dumps(data)
-            await self.send(msg)
+            msg.body = _dumps(data)
+            self._outbox.append(msg)
             try:
                 msg_logger = MessageLogger.get_instance()
                 msg_logger.log_message(
-                    sender=str(self.agent.jid),
+                    sender=self.agent._jid_str,
                     receiver=str(msg.to),
                     message_type="Notify",
                     performative="vehicle-pickup",
@@ -1468,14 +1843,15 @@ class Veiculo(Agent):
                 )
             except Exception:
                 pass  # Don't crash on logging errors
-            print(f"[{self.agent.name}] Notified {order.sender}: order {order.orderid} started")
+            self.agent.logger.debug("[%s] Notified %s: order %s started",
+                                    self.agent.name, order.sender, order.orderid)
         
         async def notify_warehouse_complete(self, order: Order):
             """
             Notifies the warehouse that the order was completed (delivery made).
             
             Sends a FIPA-ACL message to the destination warehouse/store informing that
-            the delivery was successfully completed.
+            the delivery was successfully completed (queued, see flush_outbox()).
             
             Args:
                 order: Order that was completed.
@@ -1496,17 +1872,17 @@ class Veiculo(Agent):
             
             data = {
                 "orderid": order.orderid,
-                "vehicle_id": str(self.agent.jid),
+                "vehicle_id": self.agent._jid_str,
                 "status": "completed",
                 "location": self.agent.current_location,
                 "time": order.deliver_time    
             }
-            msg.body = json.dumps(data)
-            await self.send(msg)
+            msg.body = _dumps(data)
+            self._outbox.append(msg)
             try:
                 msg_logger = MessageLogger.get_instance()
                 msg_logger.log_message(
-                    sender=str(self.agent.jid),
+                    sender=self.agent._jid_str,
                     receiver=str(msg.to),
                     message_type="Notify",
                     performative="vehicle-delivery",
@@ -1514,7 +1890,8 @@ class Veiculo(Agent):
                 )
             except Exception:
                 pass  # Don't crash on logging errors
-            print(f"[{self.agent.name}] Notified {order.receiver}: order {order.orderid} completed")
+            self.agent.logger.debug("[%s] Notified %s: order %s completed",
+                                    self.agent.name, order.receiver, order.orderid)
         
         async def notify_event_agent(self, time_left: float, next_node: int):
             """
@@ -1547,19 +1924,24 @@ class Veiculo(Agent):
             msg.set_metadata("performative", "inform")
             msg.set_metadata("type", "time-update")
             
-            data = {
-                "type": "arrival",
-                "vehicle_id": str(self.agent.jid),
-                "current_location": self.agent.current_location,
-                "next_node": next_node,
-                "time": time_left,
-            }
-            msg.body = json.dumps(data)
+            jid = self.agent._jid_str
+            current_location = self.agent.current_location
+            if (type(current_location) is int and type(next_node) is int
+                    and type(time_left) in (int, float) and math.isfinite(time_left)):
+                msg.body = _TIME_UPDATE_BODY.format(jid, current_location, next_node, time_left)
+            else:
+                msg.body = _dumps({
+                    "type": "arrival",
+                    "vehicle_id": jid,
+                    "current_location": current_location,
+                    "next_node": next_node,
+                    "time": time_left,
+                })
             await self.send(msg)
             try:
                 msg_logger = MessageLogger.get_instance()
                 msg_logger.log_message(
-                    sender=str(self.agent.jid),
+                    sender=jid,
                     receiver=str(msg.to),
                     message_type="Notify",
                     performative="inform",
@@ -1604,7 +1986,7 @@ class Veiculo(Agent):
             
             Note:
                 - If traffic_data is None or empty, returns without action
-                - Uses map.get_edge() to find bidirectional edge
+                - Applies all edges at once with map.set_edge_weights() (directed edges)
                 - Does not automatically recalculate route (consider implementing)
             """
 
@@ -1612,16 +1994,11 @@ class Veiculo(Agent):
                 return
             
             # Update edge weights based on traffic data
-            for edge_info in traffic_data.get("edges", []):
-                node1_id = edge_info.get("node1")
-                node2_id = edge_info.get("node2")
-                new_weight = edge_info.get("weight")
-                
-                edge = self.agent.map.get_edge(node1_id, node2_id)
-                if edge:
-                    edge.weight = new_weight
-            if self.agent.verbose:
-                print(f"[{self.agent.name}] Map updated with new traffic data") 
+            self.agent.map.set_edge_weights(
+                (edge_info.get("node1"), edge_info.get("node2"), edge_info.get("weight"))
+                for edge_info in traffic_data.get("edges", [])
+            )
+            self.agent.logger.debug("[%s] Map updated with new traffic data", self.agent.name)
                 
 
         async def update_location_and_time(self, time_left):
@@ -1634,12 +2011,11 @@ class Veiculo(Agent):
             (discrete movement between vertices).
             
             Algorithm:
-                1. Calculates route from current_location to next_node using Dijkstra
-                2. Converts route from Node objects to ID list
-                3. Iterates through route sequentially:
-                   - For each edge, gets required time (edge.weight)
-                   - If remaining_time >= edge_time: move to next node
-                   - If remaining_time < edge_time: stay at current node
+                1. Looks up route from current_location to next_node as node IDs
+                   (precomputed route matrix, falling back to Dijkstra)
+                2. Builds the cumulative edge times (edge.weight) along the route
+                3. Bisects the cumulative times to find the furthest node reachable
+                   within time_left, without per-edge iteration
                 4. Returns new location
             
             Args:
@@ -1655,56 +2031,74 @@ class Veiculo(Agent):
                 >>> print(new_location)  # 5 (reached node 5, but not 7)
             
             Side Effects:
-                None - method is pure, does not modify vehicle state.
+                Updates the vehicle's cached route (_cached_route, _cached_route_cum,
+                _cached_route_idx) so the next tick can resume without recomputing
+                the path.
                 Caller (run) is responsible for updating current_location.
             
             Note:
                 - Movement is discrete (only stops at vertices, not on edges)
                 - If insufficient time for any edge, stays at current node
                 - Considers next_node from actual_route[0] or actual_route[1] if [0] has order=None
+                - Returns right away when there is no time to move or the vehicle
+                  is already at the next node
             """
-            next_node_id, order = self.agent.actual_route[0]
+            agent = self.agent
+            current_pos = agent.current_location
+            if time_left <= 0:
+                return current_pos
+            actual_route = agent.actual_route
+            next_node_id, order = actual_route[0]
             if order is None:
-                next_node_id = self.agent.actual_route[1][0]
-            route_nodes, _ , _ = self.agent.map.djikstra(self.agent.current_location, next_node_id)
-            
-            # Convert route from Node objects to IDs
-            route = [node.id for node in route_nodes] if route_nodes else []
-            
-            remaining_time = time_left
-            current_pos = self.agent.current_location
-            route_index = 0
-            
-            # Iterate through route while time is available
-            while route_index < len(route) and remaining_time > 0:
-                next_node_id = route[route_index]
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] Current route: {route}")
-                    print(f"[{self.agent.name}] Trying to move to node {next_node_id} with remaining time {remaining_time}")
-                if current_pos == next_node_id:
-                    route_index += 1
-                    continue
-                
-                # Get edge between current_pos and next_node_id
-                edge = self.agent.map.get_edge(current_pos, next_node_id)
-                
-                if edge is None:
-                    # If no edge, stop
-                    break
-                
-                # Time required to traverse this edge
-                edge_time = edge.weight  # assuming weight is time
-                if self.agent.verbose: 
-                    print(f"[{self.agent.name}] Time required for edge {current_pos} -> {next_node_id}: {edge_time}")
-                
-                if remaining_time >= edge_time:
-                    # Sufficient time to reach next node
-                    current_pos = next_node_id
-                    remaining_time -= edge_time
-                    route_index += 1
-                else:
-                    # Insufficient time - stay at current node
-                    break
+                next_node_id = actual_route[1][0]
+            if next_node_id == current_pos:
+                return current_pos
+            graph = agent.map
+            
+            # Reuse the route from previous ticks while the target and the graph are
+            # unchanged and the vehicle is still where the route expects it to be
+            route = agent._cached_route
+            route_index = agent._cached_route_idx
+            route_key = (next_node_id, graph.version)
+            if (agent._cached_route_key != route_key
+                    or route_index >= len(route)
+                    or route[route_index] != current_pos):
+                # Route as node IDs, served from the precomputed matrix when possible;
+                # searched in a worker thread so the agents' event loop keeps running.
+                # The graph's route caches capture their version before filling, and
+                # route_key was read before the await, so weights changed by other
+                # agents meanwhile only leave a stale entry that the next tick replaces
+                route_ids, _ , _ = await asyncio.to_thread(graph.lookup_route, current_pos, next_node_id)
+                route = list(route_ids) if route_ids and route_ids[0] == current_pos else []
+                # Cumulative travel time from the start of the route to each of its nodes
+                edges = graph.path_edges(route)
+                # If an edge is missing, the vehicle cannot go past its source node
+                del route[len(edges) + 1:]
+                edge_times = [edge.weight for edge in edges]  # assuming weight is time
+                route_index = 0
+                agent._cached_route = route
+                agent._cached_route_idx = 0
+                agent._cached_route_cum = list(accumulate(edge_times, initial=0))
+                agent._cached_route_key = route_key
+            
+            if not route:
+                return current_pos
+            
+            # Furthest node reachable within time_left: the last one whose cumulative
+            # time fits, but stop at the first node that uses the time up exactly
+            cumulative = agent._cached_route_cum
+            time_limit = cumulative[route_index] + time_left
+            stop_index = min(bisect_right(cumulative, time_limit) - 1,
+                             bisect_left(cumulative, time_limit))
+            current_pos = route[stop_index]
+            log = agent.logger
+            log.debug("[%s] Current route: %s", agent.name, route)
+            log.debug("[%s] Moved %d node(s) to %s using %s of %s available time",
+                      agent.name, stop_index - route_index, current_pos,
+                      cumulative[stop_index] - cumulative[route_index], time_left)
+            
+            # Remember where the vehicle stopped so the next tick resumes from there
+            agent._cached_route_idx = stop_index
             
             return current_pos
 
@@ -1744,54 +2138,85 @@ class Veiculo(Agent):
         
         Note:
             - Always responds to message sender
-            - Timeout of 1s to avoid excessive CPU usage
+            - Waits up to _IDLE_RECEIVE_TIMEOUT seconds per run to avoid idle wakeups
+            - Queries arriving within BATCH_WINDOW seconds of the first one are
+              answered in the same pass, sharing one serialized body, with the
+              replies sent concurrently
         """
         
+        # Seconds to keep collecting queries after the first one of a batch
+        BATCH_WINDOW = 0.05
+        
         async def run(self):
-            msg = await self.receive(timeout=1)
+            msg = await self.receive(timeout=_IDLE_RECEIVE_TIMEOUT)
             
             if msg:
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] 📩 Presence request received from {msg.sender}")
+                # Collect the queries of a burst (e.g. a periodic poll by several
+                # agents) so they are answered in one pass
+                msgs = [msg]
+                loop = asyncio.get_running_loop()
+                deadline = loop.time() + self.BATCH_WINDOW
+                while (remaining := deadline - loop.time()) > 0:
+                    pending = await self.receive(timeout=remaining)
+                    if pending is None:
+                        break
+                    msgs.append(pending)
                 
-                # Get current presence information
-                presence_type = self.agent.presence.get_presence().type
-                presence_show = self.agent.presence.get_show()
-                presence_status = self.agent.presence.get_status()
+                for request in msgs:
+                    self.agent.logger.debug("[%s] 📩 Presence request received from %s", self.agent.name, request.sender)
                 
-                # Create response with presence and vehicle state information
-                reply = msg.make_reply()
-                reply.set_metadata("performative", "presence-response")
-                reply.set_metadata("vehicle_id", str(self.agent.jid))
+                # Current presence information, as cached by update_presence()
+                presence_type, presence_show, presence_status = self.agent._cached_presence
                 
-                response_data = {
-                    "vehicle_id": str(self.agent.jid),
-                    "presence_type": str(presence_type),
-                    "presence_show": str(presence_show),
-                    "status": presence_status if presence_status else "No status",
-                    "current_location": self.agent.current_location,
-                    "current_load": self.agent.current_load,
-                    "current_fuel": self.agent.current_fuel,
-                    "active_orders": len(self.agent.orders),
-                    "pending_orders": len(self.agent.pending_orders)
-                }
+                # The state is the same for every reply in this pass, and usually the same
+                # as in the previous pass, so only re-serialize it when a field changed
+                vehicle_id = self.agent._jid_str
+                state = (presence_type, presence_show, presence_status,
+                         self.agent.current_location, self.agent.current_load,
+                         self.agent.current_fuel, self.agent._active_orders_count,
+                         self.agent._pending_orders_count)
+                if state != self.agent._presence_json_key:
+                    response_data = {
+                        "vehicle_id": vehicle_id,
+                        "presence_type": str(presence_type),
+                        "presence_show": str(presence_show),
+                        "status": presence_status if presence_status else "No status",
+                        "current_location": self.agent.current_location,
+                        "current_load": self.agent.current_load,
+                        "current_fuel": self.agent.current_fuel,
+                        "active_orders": self.agent._active_orders_count,
+                        "pending_orders": self.agent._pending_orders_count
+                    }
+                    self.agent._presence_json_cache = _dumps(response_data)
+                    self.agent._presence_json_key = state
+                body = self.agent._presence_json_cache
                 
-                reply.body = json.dumps(response_data)
+                # Create responses with presence and vehicle state information
+                replies = []
+                for request in msgs:
+                    reply = request.make_reply()
+                    reply.set_metadata("performative", "presence-response")
+                    reply.set_metadata("vehicle_id", vehicle_id)
+                    reply.body = body
+                    replies.append(reply)
                 
-                await self.send(reply)
-                try:
-                    msg_logger = MessageLogger.get_instance()
-                    msg_logger.log_message(
-                        sender=str(self.agent.jid),
-                        receiver=str(reply.to),
-                        message_type="Confirm",
-                        performative="presence-response",
-                        body=reply.body
-                    )
-                except Exception:
-                    pass  # Don't crash on logging errors
-                if self.agent.verbose:
-                    print(f"[{self.agent.name}] ✅ Presence response sent to {msg.sender}")
-                    print(f"  Status: {presence_show}, Location: {self.agent.current_location}, Active orders: {len(self.agent.orders)}")
+                await asyncio.gather(*(self.send(reply) for reply in replies))
+                
+                for reply in replies:
+                    try:
+                        msg_logger = MessageLogger.get_instance()
+                        msg_logger.log_message(
+                            sender=self.agent._jid_str,
+                            receiver=str(reply.to),
+                            message_type="Confirm",
+                            performative="presence-response",
+                            body=reply.body
+                        )
+                    except Exception:
+                        pass  # Don't crash on logging errors
+                for request in msgs:
+                    self.agent.logger.debug("[%s] ✅ Presence response sent to %s", self.agent.name, request.sender)
+                self.agent.logger.debug("  Status: %s, Location: %s, Active orders: %d", presence_show,
+                                        self.agent.current_location, self.agent._active_orders_count)
 
                                      
\ No newline at end of file
@@ -99,8 +99,18 @@ class Edge:
         initial_weight (float): The base weight without traffic influence, used to calculate traffic factors.
         distance (float, optional): Physical distance of the edge (e.g., in meters).
         fuel_consumption (float): Calculated fuel consumption in liters for traversing this edge.
+    
+    Note:
+        ``weight``, ``initial_weight`` and ``distance`` are properties: assigning a
+        different value bumps the ``version`` of the graph that owns the edge, so
+        cached routes and edge costs computed with the old values are discarded.
+        Edges use __slots__: every road segment of the map is one instance, and
+        route reconstruction reads their attributes on each hop.
     """
     
+    __slots__ = ('node1', 'node2', '_graph', '_weight', '_initial_weight', '_distance',
+                 'fuel_consumption')
+    
     def __init__(self, node1, node2, weight=None, distance=None):
         """Initialize an Edge between two nodes.
         
@@ -113,11 +123,48 @@ class Edge:
         """
         self.node1 = node1
         self.node2 = node2
-        self.weight = weight
-        self.initial_weight = weight
-        self.distance = distance
+        self._graph = None  # Owning graph, set by Graph.add_edge
+        self._weight = weight
+        self._initial_weight = weight
+        self._distance = distance
         self.fuel_consumption = 0  # liters
     
+    @property
+    def weight(self):
+        """float: Cost of traversing the edge (e.g., travel time in seconds)."""
+        return self._weight
+    
+    @weight.setter
+    def weight(self, value):
+        if value != self._weight:
+            self._weight = value
+            if self._graph is not None:
+                self._graph.version += 1
+    
+    @property
+    def initial_weight(self):
+        """float: Base weight without traffic influence."""
+        return self._initial_weight
+    
+    @initial_weight.setter
+    def initial_weight(self, value):
+        if value != self._initial_weight:
+            self._initial_weight = value
+            if self._graph is not None:
+                self._graph.version += 1
+    
+    @property
+    def distance(self):
+        """float: Physical distance of the edge (e.g., in meters)."""
+        return self._distance
+    
+    @distance.setter
+    def distance(self, value):
+        if value != self._distance:
+            self._distance = value
+            if self._graph is not None:
+                self._graph.version += 1
+    
     def __repr__(self):
         """Return a string representation of the edge.
         
@@ -216,6 +263,10 @@ class Graph:
         nodes (dict): Dictionary mapping node IDs to Node objects.
         edges (list): List of all Edge objects in the graph (both directions).
         infected_edges (list): List of edges marked as "infected" for failure simulation.
+        version (int): Counter incremented on every edge weight change, used to
+            invalidate cached routes.
+        matrix (dict): Route matrix between nodes of interest, mapping
+            (src_id, dst_id) to (path_ids, fuel, time). See precompute_matrix().
     """
     
     def __init__(self):
@@ -223,6 +274,29 @@ class Graph:
         self.nodes = {}
         self.edges = []
         self.infected_edges = []
+        # Compressed sparse row view of the adjacency, built lazily by _get_csr()
+        self._csr = None
+        # Reverse (incoming edges) CSR view, tied to the _csr it was built from
+        self._reverse_csr = None
+        # Per-slot edge costs of the CSR view, valid for (_csr, version) only
+        self._csr_costs = None
+        # Connected component labels, tied to the _csr they were built from
+        self._components = None
+        # Cheapest incoming edge weight per node, valid for (_csr, version) only
+        self._min_incoming = None
+        # (node1 ID, node2 ID) -> Edge index, tied to the _csr it was built from
+        self._edge_index = None
+        # Bumped by Edge.weight on every change so cached routes can be invalidated
+        self.version = 0
+        # Route matrix between nodes of interest, with the version it is valid for
+        # kept in the same tuple so threads never pair a matrix with another version
+        self.matrix = {}
+        self._matrix = (-1, self.matrix)
+        self._matrix_nodes = frozenset()
+        # (version, {source index: shortest-path tree}), replaced as a whole
+        self._sssp_rows = (-1, {})
+        # (version, {(start ID, target ID): route as node IDs}), see apsp_route_ids()
+        self._route_ids = (-1, {})
     
     def add_node(self, node):
         """Add a node to the graph.
@@ -234,6 +308,7 @@ class Graph:
             node (Node): The node to add to the graph.
         """
         self.nodes[node.id] = node
+        self._csr = None
     
     def add_edge(self, node1, node2, weight=None, distance=None):
         """Add a bidirectional edge between two nodes.
@@ -256,16 +331,21 @@ class Graph:
         """
         # Create directed edge from node1 to node2
         edge1 = Edge(node1, node2, weight, distance)
+        edge1._graph = self
         self.edges.append(edge1)
         
         # Create directed edge from node2 to node1 (opposite direction)
         edge2 = Edge(node2, node1, weight, distance)
+        edge2._graph = self
         self.edges.append(edge2)
         
         # Register as neighbors bidirectionally
         node1.add_neighbor(node2)
         node2.add_neighbor(node1)
         
+        # Topology changed - the CSR view must be rebuilt
+        self._csr = None
+        
         return edge1, edge2
     
     def get_node(self, node_id):
@@ -292,13 +372,81 @@ class Graph:
         
         Returns:
             Edge: The directed edge from node1 to node2, or None if not found.
+        
+        Note:
+            Served by one lookup in the (node1 ID, node2 ID) index, which is
+            built once per topology and reused until nodes or edges change.
         """
-        node1 = self.get_node(node1_id)
-        node2 = self.get_node(node2_id)
-        for edge in self.edges:
-            if edge.node1 == node1 and edge.node2 == node2:
-                return edge
-        return None
+        return self._get_edge_index().get((node1_id, node2_id))
+    
+    def _get_edge_index(self):
+        """Return a dictionary mapping (node1 ID, node2 ID) to the directed edge between them.
+        
+        Built from the CSR view, so it holds the first edge added per direction
+        and is rebuilt whenever the topology changes.
+        
+        Returns:
+            dict: Mapping from (node1_id, node2_id) to Edge.
+        """
+        csr = self._get_csr()
+        if self._edge_index is None or self._edge_index[0] is not csr:
+            node_ids, _, indptr, indices, csr_edges = csr
+            index = {}
+            for u, node_id in enumerate(node_ids):
+                for k in range(indptr[u], indptr[u + 1]):
+                    index[(node_id, node_ids[indices[k]])] = csr_edges[k]
+            self._edge_index = (csr, index)
+        return self._edge_index[1]
+
+    def set_edge_weights(self, updates):
+        """Set the weight of several directed edges.
+        
+        Equivalent to ``get_edge(node1_id, node2_id).weight = weight`` for every
+        update whose edge exists, with each edge found by one dictionary lookup.
+        
+        Args:
+            updates: Iterable of (node1_id, node2_id, weight) tuples.
+        
+        Returns:
+            int: Number of updates that matched an edge.
+        """
+        index = self._get_edge_index()
+        matched = 0
+        for node1_id, node2_id, weight in updates:
+            edge = index.get((node1_id, node2_id))
+            if edge is not None:
+                edge.weight = weight
+                matched += 1
+        return matched
+
+    def path_edges(self, path_ids):
+        """Return the directed edges along a path of node IDs.
+        
+        Equivalent to calling get_edge() for every consecutive pair, but each
+        hop only scans the outgoing edges of its source in the CSR view instead
+        of the whole edge list.
+        
+        Args:
+            path_ids: Sequence of node IDs.
+        
+        Returns:
+            list[Edge]: Edge from path_ids[i] to path_ids[i + 1] for each hop, up to
+                (not including) the first pair with no such edge.
+        """
+        _, index_of, indptr, indices, csr_edges = self._get_csr()
+        edges = []
+        for node1_id, node2_id in zip(path_ids, path_ids[1:]):
+            u = index_of.get(node1_id)
+            v = index_of.get(node2_id)
+            if u is None or v is None:
+                break
+            for k in range(indptr[u], indptr[u + 1]):
+                if indices[k] == v:
+                    edges.append(csr_edges[k])
+                    break
+            else:
+                break
+        return edges
     
     def get_neighbors(self, node_id):
         """Retrieve all neighboring nodes for a given node.
@@ -399,6 +547,265 @@ class Graph:
                 node.id = new_id
                 new_nodes[new_id] = node
         self.nodes = new_nodes
+        self._csr = None
+
+    def _get_csr(self):
+        """Return the compressed sparse row (CSR) view of the graph, building it if needed.
+        
+        The CSR view maps every node ID to a dense integer index and stores the outgoing
+        edges of node ``i`` in the slice ``indptr[i]:indptr[i + 1]`` of the ``indices``
+        (target node index) and ``csr_edges`` (Edge object) arrays. Shortest-path
+        searches run over these flat integer arrays instead of hashing Node objects and
+        scanning the edge list for every neighbor.
+        
+        Edge objects are referenced rather than copied, so weight updates applied to
+        edges (traffic) are seen immediately. The view is invalidated whenever the
+        topology changes (add_node, add_edge, relabel_nodes).
+        
+        Returns:
+            tuple: A 5-tuple (node_ids, index_of, indptr, indices, csr_edges) where:
+                - node_ids (list): Node ID for each dense index.
+                - index_of (dict): Mapping from node ID to dense index.
+                - indptr (list[int]): Row pointers, length len(node_ids) + 1.
+                - indices (list[int]): Target node index of each outgoing edge.
+                - csr_edges (list[Edge]): Edge object of each outgoing edge.
+        """
+        if self._csr is None:
+            node_ids = list(self.nodes.keys())
+            index_of = {node_id: i for i, node_id in enumerate(node_ids)}
+            rows = [[] for _ in node_ids]
+            seen = set()
+            for edge in self.edges:
+                u = index_of.get(edge.node1.id)
+                v = index_of.get(edge.node2.id)
+                # Keep only the first edge per direction
+                if u is None or v is None or (u, v) in seen:
+                    continue
+                seen.add((u, v))
+                rows[u].append((v, edge))
+            
+            indptr = [0]
+            indices = []
+            csr_edges = []
+            for row in rows:
+                for v, edge in row:
+                    indices.append(v)
+                    csr_edges.append(edge)
+                indptr.append(len(indices))
+            self._csr = (node_ids, index_of, indptr, indices, csr_edges)
+        return self._csr
+
+    def _get_reverse_csr(self):
+        """Return the CSR view of incoming edges, building it if needed.
+        
+        Same layout as _get_csr() but row ``i`` lists the edges that end at node
+        ``i``: ``indices`` holds their source node index and ``slots`` the position
+        of the same edge in the forward view (to index ``csr_edges`` and the cost
+        arrays). Used by the backward half of djikstra_bi(). The view is rebuilt
+        whenever the forward CSR view is.
+        
+        Returns:
+            tuple: A 3-tuple (indptr, indices, slots) for incoming edges.
+        """
+        csr = self._get_csr()
+        if self._reverse_csr is None or self._reverse_csr[0] is not csr:
+            _, _, indptr, indices, _ = csr
+            rows = [[] for _ in range(len(indptr) - 1)]
+            for u in range(len(indptr) - 1):
+                for k in range(indptr[u], indptr[u + 1]):
+                    rows[indices[k]].append((u, k))
+            
+            reverse_indptr = [0]
+            reverse_indices = []
+            reverse_slots = []
+            for row in rows:
+                for u, k in row:
+                    reverse_indices.append(u)
+                    reverse_slots.append(k)
+                reverse_indptr.append(len(reverse_indices))
+            self._reverse_csr = (csr, (reverse_indptr, reverse_indices, reverse_slots))
+        return self._reverse_csr[1]
+
+    def _get_csr_costs(self):
+        """Return the traversal costs of every CSR slot, refreshing them if stale.
+        
+        Searches read edge costs from two flat lists aligned with ``csr_edges``
+        instead of reading ``edge.weight`` and recomputing the fuel consumption on
+        every relaxation. The lists are rebuilt in one pass whenever the CSR view
+        or the graph ``version`` changes, i.e. after any weight, initial weight or
+        distance update.
+        
+        Returns:
+            tuple: (weights, fuels) where weights[k] is the weight of csr_edges[k]
+                   (1 if it has none) and fuels[k] its fuel consumption in liters.
+        """
+        csr = self._get_csr()
+        # Read the version before the weights, so lists built while another
+        # thread changes weights are tagged with a version that is already stale
+        version = self.version
+        costs = self._csr_costs
+        if costs is None or costs[0] is not csr or costs[1] != version:
+            weights = []
+            fuels = []
+            for edge in csr[4]:
+                weights.append(edge.weight if edge.weight is not None else 1)
+                edge.calculate_fuel_consumption()
+                fuels.append(edge.fuel_consumption)
+            costs = self._csr_costs = (csr, version, weights, fuels)
+        return costs[2], costs[3]
+
+    def _get_components(self):
+        """Return the connected component label of every CSR index, building it if needed.
+
+        Components are found with one breadth-first sweep over the CSR view. Since
+        add_edge() always creates both directions, they are exactly the sets of
+        mutually reachable nodes. Labels depend on topology only (not on weights),
+        so they are rebuilt only when the CSR view is.
+
+        Returns:
+            list[int]: Component label for each dense node index.
+        """
+        csr = self._get_csr()
+        components = self._components
+        if components is None or components[0] is not csr:
+            _, _, indptr, indices, _ = csr
+            n = len(indptr) - 1
+            labels = [-1] * n
+            label = 0
+            for root in range(n):
+                if labels[root] != -1:
+                    continue
+                labels[root] = label
+                frontier = [root]
+                while frontier:
+                    u = frontier.pop()
+                    for k in range(indptr[u], indptr[u + 1]):
+                        v = indices[k]
+                        if labels[v] == -1:
+                            labels[v] = label
+                            frontier.append(v)
+                label += 1
+            components = self._components = (csr, labels)
+        return components[1]
+
+    def same_component(self, node1_id, node2_id):
+        """Check whether a route can exist between two nodes.
+
+        Cheap guard used before running route searches: nodes in different
+        connected components (or unknown nodes) can never be joined, whatever the
+        edge weights are.
+
+        Args:
+            node1_id: ID of the first node.
+            node2_id: ID of the second node.
+
+        Returns:
+            bool: True if both nodes exist and are in the same connected component.
+        """
+        _, index_of, _, _, _ = self._get_csr()
+        u = index_of.get(node1_id)
+        v = index_of.get(node2_id)
+        if u is None or v is None:
+            return False
+        labels = self._get_components()
+        return labels[u] == labels[v]
+
+    def min_incoming_weights(self):
+        """Return the weight of the cheapest edge entering each node.
+        
+        Any route that ends at a node other than its start crosses one of the
+        node's incoming edges, so these values give a cheap lower bound on the
+        travel time to reach it (used by the task planner to prune the search).
+        Rebuilt whenever the CSR view or the graph ``version`` changes.
+        
+        Returns:
+            dict: Mapping from node ID to the minimum incoming edge weight
+                  (missing for nodes with no incoming edge).
+        """
+        csr = self._get_csr()
+        # Read before the weights, as in _get_csr_costs()
+        version = self.version
+        cached = self._min_incoming
+        if cached is None or cached[0] is not csr or cached[1] != version:
+            node_ids = csr[0]
+            weights, _ = self._get_csr_costs()
+            reverse_indptr, _, reverse_slots = self._get_reverse_csr()
+            min_incoming = {}
+            for v, node_id in enumerate(node_ids):
+                start, end = reverse_indptr[v], reverse_indptr[v + 1]
+                if start < end:
+                    min_incoming[node_id] = min(weights[k] for k in reverse_slots[start:end])
+            cached = self._min_incoming = (csr, version, min_incoming)
+        return cached[2]
+
+    def _dijkstra_csr(self, src, dst, with_costs=False):
+        """Run Dijkstra's algorithm over the CSR arrays using integer node indices.
+        
+        Lexicographic costs are used: travel time (weight) first, fuel consumption as
+        tie-breaker. Heap entries are plain (weight, fuel, index) tuples, so comparisons
+        never fall back to Node methods, and settled nodes are tracked in a bytearray.
+        
+        Args:
+            src (int): Dense index of the start node.
+            dst (int): Dense index of the target node. The search stops as soon as it
+                       is settled; pass -1 to settle every reachable node.
+            with_costs (bool, optional): Also return the accumulated costs.
+        
+        Returns:
+            tuple: (parent, parent_edge) where parent[i] is the predecessor index of
+                   node i on its shortest path (-1 if none) and parent_edge[i] is the
+                   Edge used to reach it. Only nodes settled before the search stopped
+                   are guaranteed to hold their final values. With with_costs, the
+                   tuple also holds the (distances, fuel_consumed) lists, which for a
+                   settled node equal the unrounded totals of its path.
+        """
+        _, _, indptr, indices, csr_edges = self._get_csr()
+        weights, fuels = self._get_csr_costs()
+        n = len(indptr) - 1
+        inf = float('inf')
+        distances = [inf] * n
+        fuel_consumed = [inf] * n
+        parent = [-1] * n
+        parent_edge = [None] * n
+        settled = bytearray(n)
+        distances[src] = 0
+        fuel_consumed[src] = 0
+
+        # Min-heap priority queue: (weight_accumulated, fuel_accumulated, node_index)
+        queue = [(0, 0, src)]
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+
+        while queue:
+            current_distance, current_fuel, u = heappop(queue)
+
+            # The first pop of a node is its best (weight, fuel); later ones are stale
+            if settled[u]:
+                continue
+            settled[u] = 1
+            if u == dst:
+                # The target's path is final once it is settled
+                break
+
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if settled[v]:
+                    continue
+                new_distance = current_distance + weights[k]
+                new_fuel = current_fuel + fuels[k]
+
+                # Update if better path found (primary: lower weight, secondary: lower fuel)
+                if (new_distance < distances[v] or
+                    (new_distance == distances[v] and new_fuel < fuel_consumed[v])):
+                    distances[v] = new_distance
+                    fuel_consumed[v] = new_fuel
+                    parent[v] = u
+                    parent_edge[v] = csr_edges[k]
+                    heappush(queue, (new_distance, new_fuel, v))
+
+        if with_costs:
+            return parent, parent_edge, distances, fuel_consumed
+        return parent, parent_edge
 
     def djikstra(self, start_node_id, target_node_id):
         """Find the shortest path between two nodes using Dijkstra's algorithm.
@@ -414,10 +821,13 @@ class Graph:
         decentralized pathfinding decisions aligned with agent communication standards.
         
         Implementation Details:
-            - Uses a min-heap priority queue with tuples (weight, fuel, counter, node)
-            - The counter field ensures stable ordering when weights are equal
-            - Fuel consumption is calculated dynamically for each edge traversal
+            - Searches the CSR view of the graph (see _get_csr) with integer node indices
+            - Uses a min-heap priority queue with tuples (weight, fuel, index)
+            - Equal (weight, fuel) entries are ordered by node index
+            - Edge weights and fuel consumption are read from flat per-slot cost lists
+              (see _get_csr_costs), recomputed only when the graph version changes
             - Stops exploring paths once a superior alternative is found for each node
+            - Stops the search as soon as the target node is settled
         
         Args:
             start_node_id: ID of the starting node.
@@ -444,66 +854,401 @@ class Graph:
             # Always return (path, fuel, time) tuple for consistency
             return None, 0.0, 0.0
 
-        # Min-heap priority queue: (weight_accumulated, fuel_accumulated, counter, node)
-        # Counter ensures stable ordering when weights are equal
-        counter = 0
-        queue = [(0, 0, counter, start_node)]
+        node_ids, index_of, _, _, _ = self._get_csr()
+        dst = index_of[target_node_id]
+        parent, parent_edge = self._dijkstra_csr(index_of[start_node_id], dst)
+        path_indices, total_fuel, total_time = self._reconstruct_path(parent, parent_edge, dst)
+        path = [self.nodes[node_ids[i]] for i in path_indices]
+
+        return path, total_fuel, total_time
+
+    def djikstra_bi(self, start_node_id, target_node_id):
+        """Find the shortest path between two nodes with a bidirectional Dijkstra search.
+        
+        Grows one search forward from the start and one backward from the target
+        (over incoming edges) and stops once the two frontiers cannot improve the best
+        meeting point found so far. Each search settles roughly the nodes within half
+        the path length, so fewer nodes are settled than in djikstra() for distant
+        pairs. Costs are the same lexicographic (weight, fuel) pairs as djikstra().
+        
+        Args:
+            start_node_id: ID of the starting node.
+            target_node_id: ID of the destination node.
         
-        # Initialize distance and fuel tracking for all nodes
-        distances = {node: float('inf') for node in self.nodes.values()}
-        fuel_consumed = {node: float('inf') for node in self.nodes.values()}
-        distances[start_node] = 0
-        fuel_consumed[start_node] = 0
-        previous_nodes = {node: None for node in self.nodes.values()}
+        Returns:
+            tuple: (path_ids, total_fuel, total_time) where path_ids is the list of
+                   node IDs from start to target, and the totals are rounded to 3
+                   decimal places. The path holds only the target if it is
+                   unreachable, and ([], 0.0, 0.0) is returned if either node does
+                   not exist.
+        """
+        if start_node_id not in self.nodes or target_node_id not in self.nodes:
+            return [], 0.0, 0.0
 
-        while queue:
-            current_distance, current_fuel, _, current_node = heapq.heappop(queue)
+        node_ids, index_of, _, _, _ = self._get_csr()
+        dst = index_of[target_node_id]
+        parent, parent_edge = self._dijkstra_bi_csr(index_of[start_node_id], dst)
+        path_indices, total_fuel, total_time = self._reconstruct_path(parent, parent_edge, dst)
+        return [node_ids[i] for i in path_indices], total_fuel, total_time
 
-            # Skip if a better path was already found
-            if current_distance > distances[current_node]:
-                continue
-            if current_distance == distances[current_node] and current_fuel > fuel_consumed[current_node]:
-                continue
+    def _dijkstra_bi_csr(self, src, dst):
+        """Run a bidirectional Dijkstra search between two dense node indices.
+        
+        The forward search relaxes outgoing edges from src, the backward search
+        relaxes incoming edges towards dst. Every relaxation checks whether the node
+        is also labelled by the other search and keeps the best meeting node. The
+        loop stops when the sum of both heap tops is no better than that meeting
+        cost.
+        
+        Args:
+            src (int): Dense index of the start node.
+            dst (int): Dense index of the target node.
+        
+        Returns:
+            tuple: (parent, parent_edge) in the same form as _dijkstra_csr(), with the
+                   backward half of the path spliced in so that following parent from
+                   dst leads back to src.
+        """
+        _, _, indptr, indices, csr_edges = self._get_csr()
+        reverse_indptr, reverse_indices, reverse_slots = self._get_reverse_csr()
+        weights, fuels = self._get_csr_costs()
+        n = len(indptr) - 1
+        inf = float('inf')
+        parent = [-1] * n
+        parent_edge = [None] * n
+        if src == dst:
+            return parent, parent_edge
 
-            # Explore all neighbors
-            for neighbor in current_node.neighbors:
-                edge = self.get_edge(current_node.id, neighbor.id)
-                if edge:
-                    # Calculate traversal costs for this edge
-                    weight = edge.weight if edge.weight is not None else 1
-                    edge.calculate_fuel_consumption()
-                    fuel = edge.fuel_consumption
-                    
-                    # Calculate costs via this path
-                    new_distance = current_distance + weight
-                    new_fuel = current_fuel + fuel
-
-                    # Update if better path found (primary: lower weight, secondary: lower fuel)
-                    if (new_distance < distances[neighbor] or 
-                        (new_distance == distances[neighbor] and new_fuel < fuel_consumed[neighbor])):
-                        distances[neighbor] = new_distance
-                        fuel_consumed[neighbor] = new_fuel
-                        previous_nodes[neighbor] = current_node
-                        counter += 1
-                        heapq.heappush(queue, (new_distance, new_fuel, counter, neighbor))
-
-        # Reconstruct path from start to target
-        path = []
-        current = target_node
-        while current:
-            path.append(current)
-            current = previous_nodes[current]
-        path.reverse()
+        # Forward labels (from src) and backward labels (to dst); "next" is the
+        # following node on the path towards dst
+        forward_distance = [inf] * n
+        forward_fuel = [inf] * n
+        backward_distance = [inf] * n
+        backward_fuel = [inf] * n
+        next_node = [-1] * n
+        next_edge = [None] * n
+        forward_settled = bytearray(n)
+        backward_settled = bytearray(n)
+        forward_distance[src] = forward_fuel[src] = 0
+        backward_distance[dst] = backward_fuel[dst] = 0
+
+        forward_queue = [(0, 0, src)]
+        backward_queue = [(0, 0, dst)]
+        heappop = heapq.heappop
+        heappush = heapq.heappush
+        best_distance, best_fuel = inf, inf
+        meeting_node = -1
+
+        while forward_queue and backward_queue:
+            top_forward = forward_queue[0]
+            top_backward = backward_queue[0]
+            if (top_forward[0] + top_backward[0], top_forward[1] + top_backward[1]) >= (best_distance, best_fuel):
+                break
+
+            # Expand the side with the cheaper frontier
+            if top_forward <= top_backward:
+                current_distance, current_fuel, u = heappop(forward_queue)
+                if forward_settled[u]:
+                    continue
+                forward_settled[u] = 1
+                for k in range(indptr[u], indptr[u + 1]):
+                    v = indices[k]
+                    if forward_settled[v]:
+                        continue
+                    new_distance = current_distance + weights[k]
+                    new_fuel = current_fuel + fuels[k]
+                    if (new_distance < forward_distance[v] or
+                        (new_distance == forward_distance[v] and new_fuel < forward_fuel[v])):
+                        forward_distance[v] = new_distance
+                        forward_fuel[v] = new_fuel
+                        parent[v] = u
+                        parent_edge[v] = csr_edges[k]
+                        heappush(forward_queue, (new_distance, new_fuel, v))
+                        meeting = (new_distance + backward_distance[v], new_fuel + backward_fuel[v])
+                        if meeting < (best_distance, best_fuel):
+                            best_distance, best_fuel = meeting
+                            meeting_node = v
+            else:
+                current_distance, current_fuel, u = heappop(backward_queue)
+                if backward_settled[u]:
+                    continue
+                backward_settled[u] = 1
+                for r in range(reverse_indptr[u], reverse_indptr[u + 1]):
+                    v = reverse_indices[r]
+                    if backward_settled[v]:
+                        continue
+                    k = reverse_slots[r]
+                    new_distance = current_distance + weights[k]
+                    new_fuel = current_fuel + fuels[k]
+                    if (new_distance < backward_distance[v] or
+                        (new_distance == backward_distance[v] and new_fuel < backward_fuel[v])):
+                        backward_distance[v] = new_distance
+                        backward_fuel[v] = new_fuel
+                        next_node[v] = u
+                        next_edge[v] = csr_edges[k]
+                        heappush(backward_queue, (new_distance, new_fuel, v))
+                        meeting = (forward_distance[v] + new_distance, forward_fuel[v] + new_fuel)
+                        if meeting < (best_distance, best_fuel):
+                            best_distance, best_fuel = meeting
+                            meeting_node = v
+
+        if meeting_node == -1:
+            # Target unreachable: make sure no tentative forward label points at it
+            parent[dst] = -1
+            return parent, parent_edge
+
+        # Splice the backward half (meeting_node -> dst) into the parent arrays
+        current = meeting_node
+        while current != dst:
+            following = next_node[current]
+            parent[following] = current
+            parent_edge[following] = next_edge[current]
+            current = following
+        return parent, parent_edge
+
+    def _reconstruct_path(self, parent, parent_edge, dst):
+        """Rebuild a path from Dijkstra parent arrays and total its fuel and time.
+        
+        Args:
+            parent (list[int]): Predecessor index of each node (-1 if none).
+            parent_edge (list[Edge]): Edge used to reach each node.
+            dst (int): Dense index of the path's last node.
+        
+        Returns:
+            tuple: (path_indices, total_fuel, total_time) where path_indices is the
+                   list of dense node indices from start to dst, and the totals are
+                   rounded to 3 decimal places. If dst was not reached the path
+                   holds only dst and both totals are 0.0.
+        """
+        path_indices = []
+        path_edges = []
+        current = dst
+        while current != -1:
+            path_indices.append(current)
+            if parent_edge[current] is not None:
+                path_edges.append(parent_edge[current])
+            current = parent[current]
+        path_indices.reverse()
+        path_edges.reverse()
 
         # Calculate total fuel and time along the path
         total_fuel = 0.0
         total_time = 0.0
-        for i in range(len(path) - 1):
-            edge = self.get_edge(path[i].id, path[i + 1].id)
-            if edge:
-                # Ensure fuel consumption is calculated for this edge
-                edge.calculate_fuel_consumption()
-                total_fuel += edge.fuel_consumption
-                total_time += edge.weight
+        for edge in path_edges:
+            # Ensure fuel consumption is calculated for this edge
+            edge.calculate_fuel_consumption()
+            total_fuel += edge.fuel_consumption
+            total_time += edge.weight
+
+        return path_indices, round(total_fuel, 3), round(total_time, 3)
+
+    def precompute_matrix(self, nodes_of_interest):
+        """Precompute shortest routes between every pair of nodes of interest.
+        
+        Runs one single-source search per node of interest (depots, suppliers,
+        stores) and stores the route to every other node of interest in
+        ``self.matrix`` as ``(src_id, dst_id) -> (path_ids, fuel, time)``, where
+        path_ids is a tuple of node IDs. Lookups then cost a dictionary access
+        instead of a full Dijkstra run.
+        
+        Args:
+            nodes_of_interest (iterable): Node IDs to add to the matrix. IDs not
+                                          present in the graph are ignored. Nodes
+                                          from earlier calls are kept, since the
+                                          graph is shared by every agent.
+        
+        Note:
+            The matrix is only valid for the current graph ``version``. After a
+            weight change, lookup_route() discards it and refills rows on demand.
+        """
+        self._matrix_nodes = self._matrix_nodes.union(
+            node_id for node_id in nodes_of_interest if node_id in self.nodes)
+        matrix = self.matrix = {}
+        self._matrix = (self.version, matrix)
+        for src_id in self._matrix_nodes:
+            self._fill_matrix_row(src_id, matrix)
+
+    def _fill_matrix_row(self, src_id, matrix):
+        """Compute and store the matrix routes from src_id to every node of interest.
+        
+        Args:
+            src_id: ID of the source node (must be in the graph).
+            matrix (dict): Matrix to fill, captured by the caller together with
+                           the version it belongs to.
+        
+        Note:
+            A row computed while another thread changes weights or discards the
+            matrix lands in the captured matrix, whose version is then stale, and
+            never in the new one.
+        """
+        node_ids, index_of, _, _, _ = self._get_csr()
+        parent, parent_edge = self._dijkstra_csr(index_of[src_id], -1)
+        for dst_id in self._matrix_nodes:
+            path_indices, fuel, time = self._reconstruct_path(parent, parent_edge, index_of[dst_id])
+            matrix[(src_id, dst_id)] = (tuple(node_ids[i] for i in path_indices), fuel, time)
 
-        return path, round(total_fuel, 3), round(total_time, 3)
\ No newline at end of file
+    def compute_apsp(self):
+        """Precompute all-pairs shortest paths as one shortest-path tree per node.
+        
+        Runs a full single-source search from every node and keeps its parent
+        arrays, so apsp_route() can answer any pair by walking the tree (a
+        path-length loop) instead of running Dijkstra, along with the rounded
+        totals of every path, so route_cost() answers in O(1). Trees already
+        computed for the current graph ``version`` are reused, so calling this
+        from several agents sharing the graph costs one pass.
+        
+        The other lazily built views used by route planning (connected components
+        and cheapest incoming edges) are built here too, so agents created at
+        startup do not pay for them on their first proposal.
+        
+        Note:
+            Memory is O(V²) (four arrays of V entries per node), which is small for
+            the grid sizes used in the simulation. Trees are discarded when an edge
+            weight changes and recomputed lazily per source by apsp_route() and
+            route_cost().
+        """
+        _, index_of, _, _, _ = self._get_csr()
+        for src in index_of.values():
+            self._get_sssp_row(src)
+        self._get_components()
+        self.min_incoming_weights()
+
+    def _get_sssp_row(self, src):
+        """Return the shortest-path tree rooted at a dense node index.
+        
+        Args:
+            src (int): Dense index of the source node.
+        
+        Returns:
+            tuple: (parent, parent_edge, fuels, times) where the first two are as
+                   returned by _dijkstra_csr() for a full search from src, and
+                   fuels[i] / times[i] are the totals djikstra() reports for the
+                   path to node i (0.0 if unreachable). Computed if missing or stale.
+        """
+        # Capture the version and its rows together before searching: a tree built
+        # while weights change (other threads share the graph) is stored with the
+        # version it started from, which is then stale, never under the new one
+        version = self.version
+        rows_version, rows = self._sssp_rows
+        if rows_version != version:
+            rows = {}
+            self._sssp_rows = (version, rows)
+        row = rows.get(src)
+        if row is None:
+            parent, parent_edge, distances, fuel_consumed = self._dijkstra_csr(src, -1, with_costs=True)
+            # Costs accumulate along the path in the same order as
+            # _reconstruct_path() sums them, so the rounded totals are identical
+            reached = [i == src or p != -1 for i, p in enumerate(parent)]
+            fuels = [round(float(f), 3) if r else 0.0 for f, r in zip(fuel_consumed, reached)]
+            times = [round(float(d), 3) if r else 0.0 for d, r in zip(distances, reached)]
+            row = rows[src] = (parent, parent_edge, fuels, times)
+        return row
+
+    def route_cost(self, start_node_id, target_node_id):
+        """Return the fuel and time of the shortest path between two nodes in O(1).
+        
+        Reads the totals stored with the start node's shortest-path tree (see
+        compute_apsp()) without rebuilding the path, for callers that only need
+        the costs, such as the task planner's feasibility checks.
+        
+        Args:
+            start_node_id: ID of the starting node.
+            target_node_id: ID of the destination node.
+        
+        Returns:
+            tuple: (total_fuel, total_time) equal to the last two values of
+                   djikstra(), or (0.0, 0.0) if either node does not exist.
+        """
+        if start_node_id not in self.nodes or target_node_id not in self.nodes:
+            return 0.0, 0.0
+
+        _, index_of, _, _, _ = self._get_csr()
+        _, _, fuels, times = self._get_sssp_row(index_of[start_node_id])
+        dst = index_of[target_node_id]
+        return fuels[dst], times[dst]
+
+    def apsp_route(self, start_node_id, target_node_id):
+        """Return the shortest path between two nodes from the all-pairs trees.
+        
+        Drop-in replacement for djikstra() that reads the path from the
+        shortest-path tree of the start node (see compute_apsp()) instead of
+        searching the graph. A missing or stale tree is computed on demand.
+        
+        Args:
+            start_node_id: ID of the starting node.
+            target_node_id: ID of the destination node.
+        
+        Returns:
+            tuple: (path, total_fuel, total_time) in the same format as djikstra().
+        """
+        if start_node_id not in self.nodes or target_node_id not in self.nodes:
+            return None, 0.0, 0.0
+
+        node_ids, index_of, _, _, _ = self._get_csr()
+        dst = index_of[target_node_id]
+        parent, parent_edge, _, _ = self._get_sssp_row(index_of[start_node_id])
+        path_indices, total_fuel, total_time = self._reconstruct_path(parent, parent_edge, dst)
+        return [self.nodes[node_ids[i]] for i in path_indices], total_fuel, total_time
+
+    def apsp_route_ids(self, start_node_id, target_node_id):
+        """Return apsp_route() with the path as a tuple of node IDs, memoized per version.
+        
+        Many order proposals share the same endpoints, so the rebuilt routes are
+        kept until the graph ``version`` changes, like the other route caches.
+        
+        Args:
+            start_node_id: ID of the starting node.
+            target_node_id: ID of the destination node.
+        
+        Returns:
+            tuple: (path_ids, total_fuel, total_time) where path_ids is a tuple of
+                   node IDs (None if either node does not exist).
+        """
+        # Capture the version with its memo, as in _get_sssp_row()
+        version = self.version
+        memo_version, memo = self._route_ids
+        if memo_version != version:
+            memo = {}
+            self._route_ids = (version, memo)
+        key = (start_node_id, target_node_id)
+        entry = memo.get(key)
+        if entry is None:
+            path, fuel, time = self.apsp_route(start_node_id, target_node_id)
+            path_ids = tuple(node.id for node in path) if path is not None else None
+            entry = memo[key] = (path_ids, fuel, time)
+        return entry
+
+    def lookup_route(self, start_node_id, target_node_id):
+        """Return the shortest route between two nodes, using the route matrix when possible.
+        
+        Pairs where both nodes belong to the precomputed set are served from
+        ``self.matrix`` (refilling the source row if the graph changed since it
+        was computed). Any other pair falls back to djikstra_bi(). Vehicles call
+        it from worker threads, so the matrix is captured with its version once
+        and rows are filled into that matrix even if another call replaces it.
+        
+        Args:
+            start_node_id: ID of the starting node.
+            target_node_id: ID of the destination node.
+        
+        Returns:
+            tuple: (path_ids, fuel, time) where path_ids is a tuple of node IDs from
+                   start to target (empty if either node does not exist).
+        """
+        version = self.version
+        matrix_version, matrix = self._matrix
+        if matrix_version != version:
+            matrix = self.matrix = {}
+            self._matrix = (version, matrix)
+        
+        key = (start_node_id, target_node_id)
+        entry = matrix.get(key)
+        if entry is not None:
+            return entry
+        
+        if start_node_id in self._matrix_nodes and target_node_id in self._matrix_nodes:
+            self._fill_matrix_row(start_node_id, matrix)
+            return matrix[key]
+        
+        path_ids, fuel, time = self.djikstra_bi(start_node_id, target_node_id)
+        return tuple(path_ids), fuel, time